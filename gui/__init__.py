@@ -1,7 +1,7 @@
 """
 Avatar Generation Application GUI
 
-A Flet-based wizard interface for generating 3D avatars from photographs.
+A CustomTkinter-based wizard interface for generating 3D avatars from photographs.
 """
 
 __version__ = "0.1.0"
@@ -10,10 +10,25 @@ This module holds all shared state across wizard steps, including:
 Note: This module is UI-framework agnostic and works with any GUI toolkit.
 """
 
+import json
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Callable
-from enum import Enum, auto
+from typing import Optional, Callable, Iterable, Iterator
+from weakref import WeakValueDictionary
+from enum import Enum
+
+from .json_io import read_json, write_json
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_CONFIG_DIR = _PROJECT_ROOT / "user_configurations"
+_MARKER_DETAILS_PATH = _CONFIG_DIR / "marker_details.json"
+_CALIBRATION_PATH = _CONFIG_DIR / "calibration.json"
+_INTERMEDIATES_DIR = _PROJECT_ROOT / "intermediates"
+_MEASUREMENTS_PATH = _INTERMEDIATES_DIR / "measurements.json"
+
+# ArucoSettingsState attribute names, matching the keys in marker_details.json
+_MARKER_CORNERS = ("top_left", "top_right", "bottom_left", "bottom_right")
 
 
 class WizardStep(Enum):
@@ -26,13 +41,25 @@ class WizardStep(Enum):
     GENERATE = 5
 
 
-class RigType(Enum):
+# Adjacent wizard steps, in step order (the last step has no next, the first no previous)
+_STEP_ORDER = tuple(sorted(WizardStep, key=lambda step: step.value))
+_NEXT_STEP: dict[WizardStep, WizardStep] = dict(zip(_STEP_ORDER, _STEP_ORDER[1:]))
+_PREV_STEP: dict[WizardStep, WizardStep] = dict(zip(_STEP_ORDER[1:], _STEP_ORDER))
+
+# Bitmask of steps go_to_step may jump to from each step (bit n = step with value n):
+# the step itself and every earlier one
+_REACHABLE_FROM: dict[WizardStep, int] = {
+    step: (1 << (step.value + 1)) - 1 for step in _STEP_ORDER
+}
+
+
+class RigType(str, Enum):
     """Available rig types for avatar generation."""
     DEFAULT_NO_TOES = "default_no_toes"
     CMU_MB = "cmu_mb"
 
 
-class HairStyle(Enum):
+class HairStyle(str, Enum):
     """Available hair styles for avatar generation (legacy - will be replaced by hair assets)."""
     NONE = "none"
     SHORT = "short"
@@ -41,73 +68,74 @@ class HairStyle(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class MarkerPosition:
     """Position of a single ArUco marker."""
     x: float = 0.0
     y: float = 0.0
 
 
-@dataclass
+# Interned positions, so identical corners (loaded or entered in the UI) share one instance
+_MARKER_POSITION_CACHE: "WeakValueDictionary[tuple[float, float], MarkerPosition]" = WeakValueDictionary()
+
+
+def marker_position(x: float, y: float) -> MarkerPosition:
+    """Return the shared MarkerPosition for (x, y), creating it on first use."""
+    key = (x, y)
+    position = _MARKER_POSITION_CACHE.get(key)
+    if position is None:
+        position = MarkerPosition(x, y)
+        _MARKER_POSITION_CACHE[key] = position
+    return position
+
+
+# Default backdrop layout; MarkerPosition is frozen so these are safe to share
+_DEFAULT_TOP_LEFT = marker_position(0, 203.2)
+_DEFAULT_TOP_RIGHT = marker_position(83, 203.2)
+_DEFAULT_BOTTOM_LEFT = marker_position(0, 8.2)
+_DEFAULT_BOTTOM_RIGHT = marker_position(83, 8.2)
+
+
+@dataclass(slots=True)
 class ArucoSettingsState:
     """State for ArUco marker settings."""
     marker_size_cm: float = 16.4
-    top_left: MarkerPosition = field(default_factory=lambda: MarkerPosition(0, 203.2))
-    top_right: MarkerPosition = field(default_factory=lambda: MarkerPosition(83, 203.2))
-    bottom_left: MarkerPosition = field(default_factory=lambda: MarkerPosition(0, 8.2))
-    bottom_right: MarkerPosition = field(default_factory=lambda: MarkerPosition(83, 8.2))
+    top_left: MarkerPosition = _DEFAULT_TOP_LEFT
+    top_right: MarkerPosition = _DEFAULT_TOP_RIGHT
+    bottom_left: MarkerPosition = _DEFAULT_BOTTOM_LEFT
+    bottom_right: MarkerPosition = _DEFAULT_BOTTOM_RIGHT
 
     def get_config_dir(self) -> Path:
         """Get the user_configurations directory path."""
-        project_root = Path(__file__).resolve().parent.parent
-        return project_root / "user_configurations"
+        return _CONFIG_DIR
 
     def get_config_path(self) -> Path:
         """Get the marker_details.json path."""
-        return self.get_config_dir() / "marker_details.json"
+        return _MARKER_DETAILS_PATH
 
     def ensure_config_dir_exists(self) -> None:
         """Create the configuration directory if it doesn't exist."""
-        self.get_config_dir().mkdir(parents=True, exist_ok=True)
+        _CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
     def load_from_file(self) -> bool:
         """Load settings from marker_details.json. Returns True if successful."""
-        import json
         config_path = self.get_config_path()
         if not config_path.exists():
             return False
         try:
-            with open(config_path) as f:
-                data = json.load(f)
+            data = read_json(config_path)
             self.marker_size_cm = data.get("marker_size_cm", self.marker_size_cm)
             positions = data.get("marker_positions_cm", {})
-            if "top_left" in positions:
-                self.top_left = MarkerPosition(
-                    positions["top_left"].get("x", 0),
-                    positions["top_left"].get("y", 0)
-                )
-            if "top_right" in positions:
-                self.top_right = MarkerPosition(
-                    positions["top_right"].get("x", 0),
-                    positions["top_right"].get("y", 0)
-                )
-            if "bottom_left" in positions:
-                self.bottom_left = MarkerPosition(
-                    positions["bottom_left"].get("x", 0),
-                    positions["bottom_left"].get("y", 0)
-                )
-            if "bottom_right" in positions:
-                self.bottom_right = MarkerPosition(
-                    positions["bottom_right"].get("x", 0),
-                    positions["bottom_right"].get("y", 0)
-                )
+            for corner in _MARKER_CORNERS:
+                position = positions.get(corner)
+                if position is not None:
+                    setattr(self, corner, marker_position(position.get("x", 0), position.get("y", 0)))
             return True
         except (json.JSONDecodeError, KeyError):
             return False
 
     def save_to_file(self) -> bool:
         """Save settings to marker_details.json. Returns True if successful."""
-        import json
         self.ensure_config_dir_exists()
         config_path = self.get_config_path()
         try:
@@ -127,14 +155,13 @@ class ArucoSettingsState:
                     "vertical": "y values represent vertical position in cm from floor"
                 }
             }
-            with open(config_path, "w") as f:
-                json.dump(data, f, indent=2)
+            write_json(config_path, data)
             return True
         except Exception:
             return False
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraCalibrationState:
     """State for Camera Calibration feature."""
     image_directory: Optional[Path] = None
@@ -158,19 +185,22 @@ class CameraCalibrationState:
 
     def get_output_path(self) -> Path:
         """Get the calibration output path (absolute path)."""
-        project_root = Path(__file__).resolve().parent.parent
-        return project_root / "user_configurations" / "calibration.json"
+        return _CALIBRATION_PATH
+
+    def load_existing_calibration(self) -> Optional[dict]:
+        """
+        Check if a calibration file exists and load its metadata.
 
-    def load_existing_calibration(self) -> None:
-        """Check if a calibration file exists and load its metadata."""
-        import json
+        Returns the calibration data if a successful calibration was found, otherwise None.
+        """
         output_path = self.get_output_path()
         if output_path.exists():
-            with open(output_path) as f:
-                data = json.load(f)
+            data = read_json(output_path)
             if data.get("success"):
                 self.existing_calibration_path = output_path
                 self.existing_reprojection_error = data.get("reprojection_error")
+                return data
+        return None
 
     def reset_results(self) -> None:
         """Reset calibration results for a new run."""
@@ -181,7 +211,7 @@ class CameraCalibrationState:
         self.error_message = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageInputState:
     """State for Step 1: Image Input and Measurement Extraction."""
     front_image_path: Optional[Path] = None
@@ -213,7 +243,23 @@ class ImageInputState:
         return self.is_complete() and not self.is_extracting
 
 
-@dataclass
+# MeasurementsState fields exported by to_dict, in output order
+_MEASUREMENT_FIELDS = (
+    "height_cm",
+    "head_width_cm",
+    "shoulder_width_cm",
+    "hip_width_cm",
+    "upper_arm_length_cm",
+    "forearm_length_cm",
+    "upper_leg_length_cm",
+    "lower_leg_length_cm",
+    "shoulder_to_waist_cm",
+    "hand_length_cm",
+    "hair_length_cm",
+)
+
+
+@dataclass(slots=True)
 class MeasurementsState:
     """State for Step 2: Measurements Review."""
     # Body measurements from extraction script
@@ -249,35 +295,22 @@ class MeasurementsState:
 
     def to_dict(self) -> dict:
         """Convert measurements to dictionary format."""
-        return {
-            "height_cm": self.height_cm,
-            "head_width_cm": self.head_width_cm,
-            "shoulder_width_cm": self.shoulder_width_cm,
-            "hip_width_cm": self.hip_width_cm,
-            "upper_arm_length_cm": self.upper_arm_length_cm,
-            "forearm_length_cm": self.forearm_length_cm,
-            "upper_leg_length_cm": self.upper_leg_length_cm,
-            "lower_leg_length_cm": self.lower_leg_length_cm,
-            "shoulder_to_waist_cm": self.shoulder_to_waist_cm,
-            "hand_length_cm": self.hand_length_cm,
-            "hair_length_cm": self.hair_length_cm,
-        }
+        return {name: getattr(self, name) for name in _MEASUREMENT_FIELDS}
 
     def get_intermediates_dir(self) -> Path:
         """Get the intermediates directory path."""
-        project_root = Path(__file__).parent.parent
-        return project_root / "intermediates"
+        return _INTERMEDIATES_DIR
 
     def get_measurements_path(self) -> Path:
         """Get the measurements.json file path."""
-        return self.get_intermediates_dir() / "measurements.json"
+        return _MEASUREMENTS_PATH
 
     def ensure_intermediates_dir_exists(self) -> None:
         """Create the intermediates directory if it doesn't exist."""
-        self.get_intermediates_dir().mkdir(parents=True, exist_ok=True)
+        _INTERMEDIATES_DIR.mkdir(parents=True, exist_ok=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigureState:
     """State for Step 4: Avatar Configuration."""
     rig_type: RigType = RigType.CMU_MB
@@ -291,7 +324,7 @@ class ConfigureState:
         return True  # All fields have defaults
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputSettingsState:
     """State for Step 5: Output Settings."""
     output_directory: Optional[Path] = None
@@ -305,7 +338,7 @@ class OutputSettingsState:
         return self.output_directory is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerateState:
     """State for Step 6: Generation."""
     is_generating: bool = False
@@ -313,7 +346,7 @@ class GenerateState:
     status_message: str = ""
     output_fbx_path: Optional[Path] = None
     output_obj_path: Optional[Path] = None
-    preview_images: list[Path] = field(default_factory=list)
+    preview_images: tuple[Path, ...] = ()
     error_message: Optional[str] = None
 
     def is_complete(self) -> bool:
@@ -321,7 +354,14 @@ class GenerateState:
         return self.output_fbx_path is not None and self.error_message is None
 
 
-@dataclass
+def _paths_related(a: str, b: str) -> bool:
+    """Check whether two dotted state paths are equal or one contains the other."""
+    if not a or not b or a == b:
+        return True
+    return a.startswith(b + ".") or b.startswith(a + ".")
+
+
+@dataclass(slots=True)
 class AppState:
     """
     Main application state container.
@@ -344,71 +384,163 @@ class AppState:
     output_settings: OutputSettingsState = field(default_factory=OutputSettingsState)
     generate: GenerateState = field(default_factory=GenerateState)
 
-    _on_state_change: Optional[Callable[[], None]] = field(default=None, repr=False)
-
-    def set_on_state_change(self, callback: Callable[[], None]) -> None:
-        """Set callback to be called when state changes."""
-        self._on_state_change = callback
-
-    def notify_change(self) -> None:
-        """Notify listeners of state change."""
-        if self._on_state_change:
-            self._on_state_change()
+    # Change listeners keyed by dotted state path ("" receives every change)
+    _subscribers: dict[str, list[Callable[[], None]]] = field(default_factory=dict, repr=False)
+
+    # Nesting depth of batch_updates() blocks and the paths changed but not yet dispatched
+    _batch_depth: int = field(default=0, repr=False)
+    _pending_paths: set[str] = field(default_factory=set, repr=False)
+
+    # Optional toolkit hook (e.g. Tk's after_idle) used to defer dispatch to idle time
+    _idle_scheduler: Optional[Callable[[Callable[[], None]], object]] = field(default=None, repr=False)
+    _flush_scheduled: bool = field(default=False, repr=False)
+
+    # Set while subscribers run; changes they make are queued and dispatched in the same flush
+    _dispatching: bool = field(default=False, repr=False)
+
+    def subscribe(self, path: str, callback: Callable[[], None]) -> None:
+        """
+        Register a callback for changes at a state path.
+
+        Args:
+            path: Dotted path such as "current_step", "measurements" or
+                "measurements.height_cm". An empty path subscribes to every change.
+            callback: Called with no arguments when a related path changes.
+        """
+        self._subscribers.setdefault(path, []).append(callback)
+
+    def unsubscribe(self, path: str, callback: Callable[[], None]) -> None:
+        """Remove a callback previously registered with subscribe()."""
+        callbacks = self._subscribers.get(path)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+    def set_idle_scheduler(self, schedule: Optional[Callable[[Callable[[], None]], object]]) -> None:
+        """
+        Defer change dispatch to the UI toolkit's idle callback.
+
+        Args:
+            schedule: Function that runs a callback once the event loop is idle,
+                such as a Tk widget's after_idle. None dispatches synchronously.
+        """
+        self._idle_scheduler = schedule
+
+    def notify_change(self, path: str = "") -> None:
+        """
+        Notify listeners that the state at path changed.
+
+        Subscribers to the path itself, its ancestors and its descendants are
+        called, so replacing "measurements" also reaches "measurements.height_cm".
+        An empty path notifies every subscriber. Notifications are deferred
+        while inside batch_updates(), and when an idle scheduler is set all
+        changes made before the event loop goes idle are dispatched together.
+        """
+        self._pending_paths.add(path)
+        if not self._batch_depth and not self._dispatching:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Dispatch pending changes now, or once at idle time if a scheduler is set."""
+        if self._idle_scheduler is None:
+            self._flush_pending()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._idle_scheduler(self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        """Dispatch all pending change paths, including any queued by subscribers."""
+        self._flush_scheduled = False
+        if self._dispatching:
+            return
+        self._dispatching = True
+        try:
+            # Subscribers may notify further changes; keep draining until none are left
+            while self._pending_paths:
+                paths = tuple(self._pending_paths)
+                self._pending_paths.clear()
+                self._dispatch(paths)
+        finally:
+            self._dispatching = False
+
+    def _dispatch(self, paths: Iterable[str]) -> None:
+        """Call each subscriber related to any of the changed paths once."""
+        callbacks: list[Callable[[], None]] = []
+        for subscribed_path, subscribed_callbacks in list(self._subscribers.items()):
+            if any(_paths_related(subscribed_path, path) for path in paths):
+                for callback in subscribed_callbacks:
+                    if callback not in callbacks:
+                        callbacks.append(callback)
+        for callback in callbacks:
+            callback()
+
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        Group several state changes into a single notification.
+
+        notify_change() calls made inside the block are collapsed into one
+        dispatch when the outermost block exits. Blocks may be nested.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._pending_paths:
+                self._schedule_flush()
 
     def can_go_next(self) -> bool:
         """Check if we can proceed to the next step."""
-        if self.current_step == WizardStep.IMAGE_INPUT:
-            return self.image_input.is_complete()
-        elif self.current_step == WizardStep.MEASUREMENTS:
-            return self.measurements.is_complete()
-        elif self.current_step == WizardStep.ACCURACY_REVIEW:
-            return self.measurements.parameters_computed
-        elif self.current_step == WizardStep.CONFIGURE:
-            return self.configure.is_complete()
-        elif self.current_step == WizardStep.OUTPUT_SETTINGS:
-            return self.output_settings.is_complete()
-        elif self.current_step == WizardStep.GENERATE:
-            return False  # Last step
-        return False
+        return _CAN_GO_NEXT[self.current_step](self)
 
     def can_go_back(self) -> bool:
         """Check if we can go back to the previous step."""
-        return self.current_step != WizardStep.IMAGE_INPUT
+        return self.current_step in _PREV_STEP
 
     def go_next(self) -> bool:
         """Advance to the next step if possible."""
-        if self.can_go_next():
-            next_value = self.current_step.value + 1
-            if next_value <= WizardStep.GENERATE.value:
-                self.current_step = WizardStep(next_value)
-                self.notify_change()
-                return True
+        next_step = _NEXT_STEP.get(self.current_step)
+        if next_step is not None and self.can_go_next():
+            self.current_step = next_step
+            self.notify_change("current_step")
+            return True
         return False
 
     def go_back(self) -> bool:
         """Go back to the previous step if possible."""
-        if self.can_go_back():
-            prev_value = self.current_step.value - 1
-            if prev_value >= WizardStep.IMAGE_INPUT.value:
-                self.current_step = WizardStep(prev_value)
-                self.notify_change()
-                return True
+        prev_step = _PREV_STEP.get(self.current_step)
+        if prev_step is not None:
+            self.current_step = prev_step
+            self.notify_change("current_step")
+            return True
         return False
 
     def go_to_step(self, step: WizardStep) -> bool:
         """Navigate directly to a specific step."""
-        if step.value <= self.current_step.value:
+        if _REACHABLE_FROM[self.current_step] & (1 << step.value):
             self.current_step = step
-            self.notify_change()
+            self.notify_change("current_step")
             return True
         return False
 
     def reset(self) -> None:
         """Reset all state to initial values."""
-        self.current_step = WizardStep.IMAGE_INPUT
-        self.image_input = ImageInputState()
-        self.measurements = MeasurementsState()
-        self.configure = ConfigureState()
-        self.output_settings = OutputSettingsState()
-        self.generate = GenerateState()
-        self.notify_change()
+        with self.batch_updates():
+            self.current_step = WizardStep.IMAGE_INPUT
+            self.image_input = ImageInputState()
+            self.measurements = MeasurementsState()
+            self.configure = ConfigureState()
+            self.output_settings = OutputSettingsState()
+            self.generate = GenerateState()
+            self.notify_change()
+
+
+# Per-step "ready to advance" checks used by AppState.can_go_next (one per WizardStep)
+_CAN_GO_NEXT: dict[WizardStep, Callable[[AppState], bool]] = {
+    WizardStep.IMAGE_INPUT: lambda state: state.image_input.is_complete(),
+    WizardStep.MEASUREMENTS: lambda state: state.measurements.is_complete(),
+    WizardStep.ACCURACY_REVIEW: lambda state: state.measurements.parameters_computed,
+    WizardStep.CONFIGURE: lambda state: state.configure.is_complete(),
+    WizardStep.OUTPUT_SETTINGS: lambda state: state.output_settings.is_complete(),
+    WizardStep.GENERATE: lambda state: False,  # Last step
+}
@@ -4,19 +4,28 @@ Backend interface for the Avatar Generator application.
 This module defines the interface between the GUI and the backend modules.
 """
 
+import hashlib
 import os
 import logging
-from abc import ABC, abstractmethod
+import shutil
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional, Protocol, runtime_checkable
 import subprocess
-import json
 import sys
+import threading
+import time
+
+from .json_io import read_json, write_json
 
 # Suppress console windows for subprocess calls on Windows
 _SUBPROCESS_FLAGS = {"creationflags": subprocess.CREATE_NO_WINDOW} if sys.platform == "win32" else {}
 
-_LOG_DIR = Path(__file__).resolve().parent.parent / "logs"
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+_LOG_DIR = _PROJECT_ROOT / "logs"
 _LOG_DIR.mkdir(parents=True, exist_ok=True)
 logging.basicConfig(
     filename=str(_LOG_DIR / "avatar_generator.log"),
@@ -25,15 +34,22 @@ logging.basicConfig(
 )
 _logger = logging.getLogger(__name__)
 
+# Trailing stderr lines kept in memory for error messages
+_STDERR_TAIL_LINES = 200
+
+# Trailing stdout lines used as the error message when a script writes nothing to stderr
+_STDOUT_ERROR_LINES = 5
 
-class BackendInterface(ABC):
+
+@runtime_checkable
+class BackendInterface(Protocol):
     """
-    Abstract interface for backend operations.
+    Interface for backend operations.
 
-    Defines the contract between GUI and backend modules.
+    Defines the contract between GUI and backend modules. Implementations
+    satisfy it structurally and do not need to inherit from it.
     """
 
-    @abstractmethod
     def extract_measurements(
         self,
         front_image: Path,
@@ -42,6 +58,7 @@ class BackendInterface(ABC):
         marker_details_path: Path,
         gender: str,
         race: str,
+        log_callback: Callable[[str], None] = None,
     ) -> dict:
         """
         Extract body measurements from front image using calibration data.
@@ -53,13 +70,13 @@ class BackendInterface(ABC):
             marker_details_path: Path to ArUco marker details JSON
             gender: Subject's gender ("male" or "female")
             race: Subject's race ("asian" or "caucasian")
+            log_callback: Optional callback for streaming log output lines
 
         Returns:
             Dictionary containing gender, race, body_measurements, hair_measurements, and visualization_path
         """
-        pass
+        ...
 
-    @abstractmethod
     def generate_avatar(
         self,
         measurements: dict,
@@ -77,9 +94,8 @@ class BackendInterface(ABC):
         Returns:
             Dictionary containing output paths and preview images
         """
-        pass
+        ...
 
-    @abstractmethod
     def open_in_blender(self, file_path: Path) -> None:
         """
         Open a file in Blender.
@@ -87,15 +103,15 @@ class BackendInterface(ABC):
         Args:
             file_path: Path to the file to open
         """
-        pass
+        ...
 
-    @abstractmethod
     def calibrate_camera(
         self,
         image_dir: Path,
         checkerboard_size: tuple[int, int],
         square_size_mm: float,
         output_path: Path,
+        log_callback: Callable[[str], None] = None,
     ) -> dict:
         """
         Calibrate camera using checkerboard pattern images.
@@ -105,13 +121,13 @@ class BackendInterface(ABC):
             checkerboard_size: Inner corner count (columns, rows)
             square_size_mm: Physical size of each square in mm
             output_path: Path to save calibration JSON
+            log_callback: Optional callback for streaming log output lines
 
         Returns:
             Dictionary containing calibration results
         """
-        pass
+        ...
 
-    @abstractmethod
     def compute_mesh_parameters(
         self,
         measurements_path: Path,
@@ -125,10 +141,34 @@ class BackendInterface(ABC):
         Returns:
             Dictionary containing the parameters report with target vs actual comparisons
         """
-        pass
+        ...
+
+    def extract_measurements_async(self, **kwargs) -> Future:
+        """
+        Run extract_measurements on a background worker.
+
+        Args:
+            **kwargs: Arguments for extract_measurements
 
+        Returns:
+            Future resolving to the extract_measurements result
+        """
+        ...
+
+    def calibrate_camera_async(self, **kwargs) -> Future:
+        """
+        Run calibrate_camera on a background worker.
+
+        Args:
+            **kwargs: Arguments for calibrate_camera
 
-class RealBackendInterface(BackendInterface):
+        Returns:
+            Future resolving to the calibrate_camera result
+        """
+        ...
+
+
+class RealBackendInterface:
     """
     Real implementation of the backend interface.
 
@@ -153,6 +193,134 @@ class RealBackendInterface(BackendInterface):
         self.mesh_module_path = mesh_module_path
         self.blender_path = blender_path
 
+        # Resolved once; every backend call reuses these paths
+        self._intermediates_dir = _PROJECT_ROOT / "intermediates"
+        self._measurements_json = self._intermediates_dir / "measurements.json"
+        self._visualization_image = self._intermediates_dir / "measurement_visualization.jpg"
+        self._mesh_parameters_json = self._intermediates_dir / "mesh_parameters.json"
+        self._parameters_report_json = self._intermediates_dir / "parameters_report.json"
+        self._measurements_module = (
+            Path(measurements_module_path) if measurements_module_path
+            else _PROJECT_ROOT / "measurements_extraction_module"
+        )
+        self._measurements_python = self._measurements_module / "venv" / "Scripts" / "python.exe"
+        self._mesh_module = (
+            Path(mesh_module_path) if mesh_module_path
+            else _PROJECT_ROOT / "mesh_generation_module"
+        )
+        self._mesh_python = self._mesh_module / "myenv" / "Scripts" / "python.exe"
+
+        # Static argv prefixes (interpreter + script) for each submodule script
+        measurements_python = os.fspath(self._measurements_python)
+        mesh_python = os.fspath(self._mesh_python)
+        self._extract_prefix = (
+            measurements_python, os.fspath(self._measurements_module / "complete_measurements.py"),
+        )
+        self._calibrate_prefix = (
+            measurements_python, os.fspath(self._measurements_module / "calibrate_camera.py"),
+        )
+        self._mesh_parameters_prefix = (
+            mesh_python, os.fspath(self._mesh_module / "compute_all_parameters.py"),
+        )
+        self._blender_prefix = (
+            mesh_python, "-u", os.fspath(self._mesh_module / "run_blender.py"),
+        )
+
+        # Interpreters already found on disk (a missing venv is re-checked on each call)
+        self._verified_pythons: set[Path] = set()
+
+        # Whether the intermediates directory has been created (reset when it is cleaned up)
+        self._intermediates_ready = False
+
+        # Shared workers for the *_async methods, so the GUI never spawns its own threads
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="backend")
+
+    def _require_python(self, python_path: Path, setup_hint: str) -> None:
+        """Raise if a submodule's venv interpreter is missing, checking disk only until found."""
+        if python_path in self._verified_pythons:
+            return
+        if not python_path.exists():
+            raise RuntimeError(
+                f"Virtual environment Python not found at {python_path}. "
+                f"Please set up the {setup_hint}."
+            )
+        self._verified_pythons.add(python_path)
+
+    def _ensure_intermediates_dir(self) -> Path:
+        """Create the intermediates directory once, until the next cleanup removes it."""
+        if not self._intermediates_ready:
+            self._intermediates_dir.mkdir(parents=True, exist_ok=True)
+            self._intermediates_ready = True
+        return self._intermediates_dir
+
+    def _run_streamed(
+        self,
+        cmd: list[str],
+        cwd: Path,
+        log_name: str,
+        log_callback: Callable[[str], None] = None,
+        timeout: float = None,
+    ) -> tuple[int, str]:
+        """
+        Run a submodule script, streaming its stdout and stderr line by line.
+
+        Each line is written to the log file and passed to log_callback as it arrives,
+        instead of being buffered until the process exits. stderr is read on its
+        own pipe so a failing script's traceback is not buried in progress output.
+
+        Raises:
+            subprocess.TimeoutExpired: If timeout seconds pass before the script exits
+
+        Returns:
+            Tuple of (exit code, error text). The error text is the script's
+            stderr, or its last few stdout lines if stderr was empty.
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            stdin=subprocess.DEVNULL,
+            text=True,
+            cwd=str(cwd),
+            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+            **_SUBPROCESS_FLAGS,
+        )
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, kill_on_timeout) if timeout else None
+        if timer:
+            timer.start()
+
+        def pump(stream, tail: deque) -> None:
+            for line in iter(stream.readline, ""):
+                stripped = line.rstrip("\n")
+                tail.append(stripped)
+                _logger.info("%s: %s", log_name, stripped)
+                if log_callback:
+                    log_callback(stripped)
+
+        stdout_tail = deque(maxlen=_STDOUT_ERROR_LINES)
+        stderr_tail = deque(maxlen=_STDERR_TAIL_LINES)
+        stderr_reader = threading.Thread(target=pump, args=(process.stderr, stderr_tail), daemon=True)
+        stderr_reader.start()
+        try:
+            pump(process.stdout, stdout_tail)
+            stderr_reader.join()
+            process.wait()
+        finally:
+            if timer:
+                timer.cancel()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout, output="\n".join(stdout_tail))
+        error_text = "\n".join(stderr_tail).strip() or "\n".join(stdout_tail).strip()
+        return process.returncode, error_text
+
     def extract_measurements(
         self,
         front_image: Path,
@@ -161,6 +329,7 @@ class RealBackendInterface(BackendInterface):
         marker_details_path: Path,
         gender: str,
         race: str,
+        log_callback: Callable[[str], None] = None,
     ) -> dict:
         """
         Extract measurements using the measurements_extraction_module.
@@ -168,59 +337,36 @@ class RealBackendInterface(BackendInterface):
         Runs the complete_measurements.py script using the submodule's venv Python.
         After extraction, appends gender and race to the measurements.json file.
         """
-        project_root = Path(__file__).resolve().parent.parent
-        module_path = project_root / "measurements_extraction_module"
-        script_path = module_path / "complete_measurements.py"
-        venv_python = module_path / "venv" / "Scripts" / "python.exe"
-
-        if not venv_python.exists():
-            raise RuntimeError(
-                f"Virtual environment Python not found at {venv_python}. "
-                "Please set up the measurements_extraction_module venv."
-            )
+        module_path = self._measurements_module
+        self._require_python(self._measurements_python, "measurements_extraction_module venv")
 
         # Create intermediates directory for outputs
-        intermediates_dir = project_root / "intermediates"
-        intermediates_dir.mkdir(parents=True, exist_ok=True)
+        intermediates_dir = self._ensure_intermediates_dir()
 
         # Output paths
-        output_measurements = intermediates_dir / "measurements.json"
+        output_measurements = self._measurements_json
         visualization_dir = intermediates_dir
 
         cmd = [
-            str(venv_python),
-            str(script_path),
-            str(front_image),
-            "--marker-details", str(marker_details_path),
-            "--camera-calibration", str(camera_calibration_path),
+            *self._extract_prefix,
+            os.fspath(front_image),
+            "--marker-details", os.fspath(marker_details_path),
+            "--camera-calibration", os.fspath(camera_calibration_path),
             "--height", str(height_cm),
-            "-o", str(output_measurements),
-            "--save-visualization", str(visualization_dir),
+            "-o", os.fspath(output_measurements),
+            "--save-visualization", os.fspath(visualization_dir),
         ]
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            stdin=subprocess.DEVNULL,
-            cwd=str(module_path),
-            **_SUBPROCESS_FLAGS,
-        )
-
-        if result.stdout:
-            _logger.info("measurements stdout:\n%s", result.stdout)
-        if result.stderr:
-            _logger.warning("measurements stderr:\n%s", result.stderr)
+        returncode, error_text = self._run_streamed(cmd, module_path, "measurements", log_callback)
 
-        if result.returncode != 0:
-            error_msg = result.stderr or result.stdout or "Unknown error"
+        if returncode != 0:
+            error_msg = error_text or "Unknown error"
             raise RuntimeError(f"Measurement extraction failed: {error_msg}")
 
-        if not output_measurements.exists():
-            raise RuntimeError("Extraction completed but output file not created")
-
-        with open(output_measurements) as f:
-            measurements = json.load(f)
+        try:
+            measurements = read_json(output_measurements)
+        except FileNotFoundError:
+            raise RuntimeError("Extraction completed but output file not created") from None
 
         # Add gender and race to measurements and save back.
         # "body_measurements" is the current key; fall back to legacy "measurements"
@@ -236,11 +382,12 @@ class RealBackendInterface(BackendInterface):
             "hair_measurements": measurements.get("hair_measurements", {}),
         }
 
-        with open(output_measurements, "w") as f:
-            json.dump(updated_measurements, f, indent=2)
+        # Skip the rewrite when the file already has exactly this shape
+        if updated_measurements != measurements:
+            write_json(output_measurements, updated_measurements, indent=False)
 
         # Check for visualization image
-        visualization_path = visualization_dir / "measurement_visualization.jpg"
+        visualization_path = self._visualization_image
         if not visualization_path.exists():
             visualization_path = None
 
@@ -263,148 +410,141 @@ class RealBackendInterface(BackendInterface):
 
         Runs generate_human.py in Blender with the specified configuration.
         """
-        project_root = Path(__file__).resolve().parent.parent
-        module_path = project_root / "mesh_generation_module"
+        module_path = self._mesh_module
+
+        # Read each configuration value once
+        output_name = config["output_filename"]
+        output_directory = config["output_directory"]
+        rig_type = config["rig_type"]
+        fk_ik_hybrid = config.get("fk_ik_hybrid")
+        t_pose = config.get("t_pose")
+        bvh_animation_path = config.get("bvh_animation_path")
+        hair_asset = config.get("hair_asset")
+        apply_clothing = config.get("apply_clothing")
+        export_fbx = config.get("export_fbx", True)
+        export_obj = config.get("export_obj", False)
 
         # Get mesh_parameters.json path (created by compute_all_parameters.py)
-        intermediates_dir = project_root / "intermediates"
-        mesh_parameters_path = intermediates_dir / "mesh_parameters.json"
+        mesh_parameters_path = self._mesh_parameters_json
 
-        if not mesh_parameters_path.exists():
+        # Update mesh_parameters.json with output configuration
+        try:
+            mesh_params_data = read_json(mesh_parameters_path)
+        except FileNotFoundError:
             raise RuntimeError(
                 f"Mesh parameters file not found at {mesh_parameters_path}. "
                 "Please complete the accuracy review step first."
-            )
-
-        # Update mesh_parameters.json with output configuration
-        with open(mesh_parameters_path) as f:
-            mesh_params_data = json.load(f)
+            ) from None
 
         # Add output section to config
-        output_filename = config["output_filename"] + ".fbx"
         mesh_params_data["output"] = {
-            "directory": config["output_directory"],
-            "filename": output_filename
+            "directory": output_directory,
+            "filename": output_name + ".fbx",
         }
 
         # Save updated mesh parameters
-        with open(mesh_parameters_path, "w") as f:
-            json.dump(mesh_params_data, f, indent=2)
+        write_json(mesh_parameters_path, mesh_params_data, indent=False)
 
         # Get output directory
-        output_dir = Path(config["output_directory"])
+        output_dir = Path(output_directory)
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Build command using run_blender.py wrapper
-        run_blender_script = module_path / "run_blender.py"
-        myenv_python = module_path / "myenv" / "Scripts" / "python.exe"
-
-        if not myenv_python.exists():
-            raise RuntimeError(
-                f"Virtual environment Python not found at {myenv_python}. "
-                "Please set up the mesh_generation_module myenv."
-            )
+        self._require_python(self._mesh_python, "mesh_generation_module myenv")
 
         cmd = [
-            str(myenv_python),
-            "-u",
-            str(run_blender_script),
+            *self._blender_prefix,
             "--script", "generate_human.py",
             "--",
-            "--config", str(mesh_parameters_path),
-            "--rig-type", config["rig_type"],
-            "--output-dir", str(output_dir),
+            "--config", os.fspath(mesh_parameters_path),
+            "--rig-type", rig_type,
+            "--output-dir", os.fspath(output_dir),
         ]
 
         # Add optional flags
-        if config.get("fk_ik_hybrid"):
+        if fk_ik_hybrid:
             cmd.append("--fk-ik-hybrid")
 
-        if config.get("t_pose"):
+        if t_pose:
             cmd.append("--t-pose")
 
         # Add BVH animation file if specified
-        if config.get("bvh_animation_path"):
-            cmd.extend(["--animation", str(config["bvh_animation_path"])])
+        if bvh_animation_path:
+            cmd.extend(["--animation", os.fspath(bvh_animation_path)])
 
         # Add hair asset if specified
-        if config.get("hair_asset"):
-            cmd.extend(["--hair", config["hair_asset"]])
+        if hair_asset:
+            cmd.extend(["--hair", hair_asset])
 
         # Add clothing assets if enabled
-        if config.get("apply_clothing"):
+        if apply_clothing:
             cmd.extend(["--clothing", "Scrub_Pants", "Scrub_Shirt"])
 
         # Run Blender via run_blender.py, streaming stdout line by line
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            cwd=str(module_path),
-            env={**os.environ, "PYTHONUNBUFFERED": "1"},
-            **_SUBPROCESS_FLAGS,
-        )
+        returncode, _ = self._run_streamed(cmd, module_path, "generation", log_callback)
 
-        for line in iter(process.stdout.readline, ""):
-            stripped = line.rstrip("\n")
-            if log_callback:
-                log_callback(stripped)
-
-        process.wait()
-
-        if process.returncode != 0:
-            raise RuntimeError(f"Avatar generation failed (exit code {process.returncode})")
+        if returncode != 0:
+            raise RuntimeError(f"Avatar generation failed (exit code {returncode})")
 
         # Find output files
-        output_filename = config["output_filename"]
         fbx_path = None
         obj_path = None
 
-        if config.get("export_fbx", True):
-            fbx_path = output_dir / f"{output_filename}.fbx"
+        if export_fbx:
+            fbx_path = output_dir / f"{output_name}.fbx"
             if not fbx_path.exists():
                 raise RuntimeError(f"Expected FBX output not found at {fbx_path}")
 
-        if config.get("export_obj", False):
-            obj_path = output_dir / f"{output_filename}.obj"
+        if export_obj:
+            obj_path = output_dir / f"{output_name}.obj"
             if not obj_path.exists():
                 obj_path = None  # Optional, don't fail if not found
 
         # Clean up intermediates directory after successful export
-        try:
-            import shutil
-            if intermediates_dir.exists():
-                shutil.rmtree(intermediates_dir)
-        except Exception as e:
-            # Don't fail if cleanup fails
-            print(f"Warning: Could not clean up intermediates directory: {e}")
+        self._discard_intermediates()
 
         return {
             "fbx_path": str(fbx_path) if fbx_path else None,
             "obj_path": str(obj_path) if obj_path else None,
-            "preview_images": [],
+            "preview_images": (),
         }
 
+    def _discard_intermediates(self) -> None:
+        """
+        Move the intermediates directory aside and delete it on a backend worker.
+
+        The rename is a single atomic call, so the next run starts with a fresh
+        directory straight away while the old tree is removed in the background.
+        """
+        self._intermediates_ready = False
+        intermediates_dir = self._intermediates_dir
+        scratch_dir = intermediates_dir.with_name(
+            f"{intermediates_dir.name}.gc.{os.getpid()}.{time.time_ns()}"
+        )
+        try:
+            os.rename(intermediates_dir, scratch_dir)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            # Don't fail if cleanup fails
+            _logger.warning("Could not clean up intermediates directory: %s", e)
+            return
+        self._executor.submit(self._remove_tree, scratch_dir)
+
+    def _remove_tree(self, path: Path) -> None:
+        """Delete a discarded directory tree. Failures are only logged."""
+        try:
+            shutil.rmtree(path)
+        except Exception as e:
+            _logger.warning("Could not remove %s: %s", path, e)
+
     def open_in_blender(self, file_path: Path) -> None:
         """
         Open file in Blender GUI.
 
         Opens the specified file in Blender. Assumes Blender is in PATH or BLENDER_PATH is set.
         """
-        import os
-        import shutil
-
-        # Try to find Blender executable
-        blender_exe = None
-
-        # Check BLENDER_PATH environment variable
-        blender_env = os.environ.get("BLENDER_PATH")
-        if blender_env and Path(blender_env).exists():
-            blender_exe = blender_env
-        else:
-            # Try to find in PATH
-            blender_exe = shutil.which("blender")
+        blender_exe = _find_blender(os.environ.get("BLENDER_PATH"))
 
         if not blender_exe:
             raise RuntimeError(
@@ -413,7 +553,7 @@ class RealBackendInterface(BackendInterface):
             )
 
         # Open file in Blender GUI (non-blocking)
-        subprocess.Popen([blender_exe, str(file_path)], **_SUBPROCESS_FLAGS)
+        subprocess.Popen([blender_exe, os.fspath(file_path)], **_SUBPROCESS_FLAGS)
 
     def calibrate_camera(
         self,
@@ -421,66 +561,91 @@ class RealBackendInterface(BackendInterface):
         checkerboard_size: tuple[int, int],
         square_size_mm: float,
         output_path: Path,
+        log_callback: Callable[[str], None] = None,
     ) -> dict:
         """
         Calibrate camera using the measurements_extraction_module.
 
         Runs the calibrate_camera.py script using the submodule's venv Python.
         """
-        project_root = Path(__file__).resolve().parent.parent
-        module_path = project_root / "measurements_extraction_module"
-        script_path = module_path / "calibrate_camera.py"
-        venv_python = module_path / "venv" / "Scripts" / "python.exe"
-
-        if not venv_python.exists():
-            raise RuntimeError(
-                f"Virtual environment Python not found at {venv_python}. "
-                "Please set up the measurements_extraction_module venv."
-            )
+        module_path = self._measurements_module
+        self._require_python(self._measurements_python, "measurements_extraction_module venv")
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         cols, rows = checkerboard_size
         checkerboard_arg = f"{cols}x{rows}"
 
+        # Reuse the previous results when the images and pattern settings are unchanged.
+        # The cached results are written back to output_path, which the rest of the app
+        # reads, so the file on disk always matches what is returned.
+        cache_path = output_path.with_suffix(".cache.json")
+        try:
+            cache_key = self._calibration_key(
+                image_dir,
+                f"{os.fspath(image_dir)}|{checkerboard_arg}|{square_size_mm}|{os.fspath(output_path)}",
+            )
+        except OSError:
+            # Unreadable or missing folder: skip the cache and let the script report it
+            cache_key = None
+        try:
+            cached = read_json(cache_path)
+            if cache_key is not None and cached.get("key") == cache_key:
+                _logger.info("Using cached calibration results from %s", cache_path)
+                write_json(output_path, cached["results"])
+                return cached["results"]
+        except (FileNotFoundError, ValueError, KeyError, AttributeError):
+            pass
+
+        # A new run replaces output_path, so the old entry no longer describes it
+        cache_path.unlink(missing_ok=True)
+
         cmd = [
-            str(venv_python),
-            str(script_path),
-            "-i", str(image_dir),
-            "-o", str(output_path),
+            *self._calibrate_prefix,
+            "-i", os.fspath(image_dir),
+            "-o", os.fspath(output_path),
             "--checkerboard-size", checkerboard_arg,
             "--square-size", str(square_size_mm),
         ]
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            stdin=subprocess.DEVNULL,
-            cwd=str(module_path),
-            **_SUBPROCESS_FLAGS,
-        )
-
-        if result.stdout:
-            _logger.info("calibration stdout:\n%s", result.stdout)
-        if result.stderr:
-            _logger.warning("calibration stderr:\n%s", result.stderr)
+        returncode, error_text = self._run_streamed(cmd, module_path, "calibration", log_callback)
 
-        if result.returncode != 0:
-            error_msg = result.stderr or result.stdout or "Unknown error"
+        if returncode != 0:
+            error_msg = error_text or "Unknown error"
             return {
                 "success": False,
                 "error": f"Calibration script failed: {error_msg}",
             }
 
-        if not output_path.exists():
+        try:
+            results = read_json(output_path)
+        except FileNotFoundError:
             return {
                 "success": False,
                 "error": "Calibration completed but output file not created",
             }
 
-        with open(output_path) as f:
-            return json.load(f)
+        if cache_key is not None and results.get("success", False):
+            write_json(cache_path, {"key": cache_key, "results": results}, indent=False)
+        return results
+
+    @staticmethod
+    def _calibration_key(image_dir: Path, settings: str) -> str:
+        """Fingerprint the calibration images (names, sizes, mtimes) and pattern settings."""
+        digest = hashlib.blake2b(settings.encode("utf-8"), digest_size=16)
+        for entry in sorted(os.scandir(image_dir), key=lambda e: e.name):
+            if entry.is_file():
+                stat = entry.stat()
+                digest.update(f"\0{entry.name}\0{stat.st_size}\0{stat.st_mtime_ns}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def extract_measurements_async(self, **kwargs) -> Future:
+        """Submit extract_measurements to the backend worker pool."""
+        return self._executor.submit(self.extract_measurements, **kwargs)
+
+    def calibrate_camera_async(self, **kwargs) -> Future:
+        """Submit calibrate_camera to the backend worker pool."""
+        return self._executor.submit(self.calibrate_camera, **kwargs)
 
     def compute_mesh_parameters(
         self,
@@ -491,20 +656,11 @@ class RealBackendInterface(BackendInterface):
 
         Runs compute_all_parameters.py to infer macroparameters and adjust microparameters.
         """
-        project_root = Path(__file__).resolve().parent.parent
-        module_path = project_root / "mesh_generation_module"
-        script_path = module_path / "compute_all_parameters.py"
-        myenv_python = module_path / "myenv" / "Scripts" / "python.exe"
-
-        if not myenv_python.exists():
-            raise RuntimeError(
-                f"Virtual environment Python not found at {myenv_python}. "
-                "Please set up the mesh_generation_module myenv."
-            )
+        module_path = self._mesh_module
+        self._require_python(self._mesh_python, "mesh_generation_module myenv")
 
         # Read measurements to get gender and race
-        with open(measurements_path) as f:
-            measurements_data = json.load(f)
+        measurements_data = read_json(measurements_path)
 
         gender = measurements_data.get("gender", "male")
         race = measurements_data.get("race", "asian")
@@ -521,52 +677,57 @@ class RealBackendInterface(BackendInterface):
             )
 
         # Output paths
-        intermediates_dir = project_root / "intermediates"
-        intermediates_dir.mkdir(parents=True, exist_ok=True)
-        output_params = intermediates_dir / "mesh_parameters.json"
-        output_report = intermediates_dir / "parameters_report.json"
+        self._ensure_intermediates_dir()
+        output_params = self._mesh_parameters_json
+        output_report = self._parameters_report_json
 
         cmd = [
-            str(myenv_python),
-            str(script_path),
-            "--input", str(measurements_path),
-            "--models", str(weights_path),
-            "--output", str(output_params),
-            "--report", str(output_report),
+            *self._mesh_parameters_prefix,
+            "--input", os.fspath(measurements_path),
+            "--models", os.fspath(weights_path),
+            "--output", os.fspath(output_params),
+            "--report", os.fspath(output_report),
         ]
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            stdin=subprocess.DEVNULL,
-            cwd=str(module_path),
+        returncode, error_text = self._run_streamed(
+            cmd, module_path, "mesh parameters",
             timeout=600,  # 10 minute timeout
-            **_SUBPROCESS_FLAGS,
         )
 
-        if result.stdout:
-            _logger.info("mesh parameters stdout:\n%s", result.stdout)
-        if result.stderr:
-            _logger.warning("mesh parameters stderr:\n%s", result.stderr)
-
-        if result.returncode != 0:
-            error_msg = result.stderr or result.stdout or "Unknown error"
+        if returncode != 0:
+            error_msg = error_text or "Unknown error"
             raise RuntimeError(f"Parameter computation failed: {error_msg}")
 
-        if not output_report.exists():
-            raise RuntimeError("Computation completed but report file not created")
+        try:
+            return read_json(output_report)
+        except FileNotFoundError:
+            raise RuntimeError("Computation completed but report file not created") from None
+
+
+def _find_blender(blender_env: Optional[str]) -> Optional[str]:
+    """
+    Locate the Blender executable.
 
-        with open(output_report) as f:
-            report = json.load(f)
+    Args:
+        blender_env: Current value of the BLENDER_PATH environment variable
 
-        return report
+    Returns:
+        Path to the Blender executable, or None if it cannot be found
+    """
+    # Check BLENDER_PATH environment variable
+    if blender_env and Path(blender_env).exists():
+        return blender_env
+    # Try to find in PATH
+    return shutil.which("blender")
 
 
+@lru_cache(maxsize=1)
 def get_backend() -> BackendInterface:
     """
     Factory function to get the backend interface.
 
+    The backend is created once and shared by every caller.
+
     Returns:
         BackendInterface implementation
     """
@@ -1,5 +1,9 @@
 """
 Reusable GUI components for the Avatar Generator application.
+
+Components never call update() on Tk widgets, since that re-enters the event
+loop from inside a callback. They reconfigure widgets in place and let Tk
+redraw when idle; use update_idletasks() if a redraw is needed mid-callback.
 """
 
 from .wizard_nav import WizardNav
@@ -6,10 +6,33 @@ Provides a file picker with image preview functionality.
 
 import customtkinter as ctk
 from tkinter import filedialog
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 from PIL import Image
 
+from .ui_elements import add_bindtag, get_font
+
+
+@lru_cache(maxsize=32)
+def _load_thumbnail(path: str, mtime_ns: int, max_size: tuple[int, int]) -> Image.Image:
+    """
+    Decode an image file and shrink it to fit max_size.
+
+    Cached per file version (mtime_ns is part of the key), so reselecting the
+    same unchanged file skips the decode and resample.
+    """
+    with Image.open(path) as pil_image:
+        pil_image.thumbnail(max_size, Image.Resampling.LANCZOS)
+        pil_image.load()
+        return pil_image
+
+
+def _decode_preview(path: Path, max_size: tuple[int, int]) -> Image.Image:
+    """Load the preview thumbnail for path (runs on the decode pool)."""
+    return _load_thumbnail(str(path), path.stat().st_mtime_ns, max_size)
+
 
 class ImagePicker(ctk.CTkFrame):
     """
@@ -35,6 +58,12 @@ class ImagePicker(ctk.CTkFrame):
         "text_hint": "#60a5fa",
     }
 
+    # Shared workers that decode previews off the Tk thread
+    _DECODE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="image-preview")
+
+    # Directory of the last selected image, shared so every picker's dialog opens there
+    _last_directory: Optional[str] = None
+
     def __init__(
         self,
         parent: ctk.CTkFrame,
@@ -62,9 +91,16 @@ class ImagePicker(ctk.CTkFrame):
         self._width = width
         self._height = height
         self._enabled = True
+        # Incremented per set_image() so previews of superseded selections are dropped
+        self._decode_token = 0
 
         self._build()
-        self.bind("<Button-1>", self._open_file_picker)
+
+        # A single class binding handles clicks anywhere in the picker: Tk does not
+        # pass clicks up to parent widgets, so every descendant carries the tag instead
+        self._click_tag = f"ImagePickerClick{self}"
+        self.bind_class(self._click_tag, "<Button-1>", self._open_file_picker)
+        add_bindtag(self, self._click_tag)
 
     def _build(self) -> None:
         """Build the image picker component."""
@@ -81,40 +117,35 @@ class ImagePicker(ctk.CTkFrame):
         icon_label = ctk.CTkLabel(
             frame,
             text="+",
-            font=ctk.CTkFont(size=48),
+            font=get_font(48),
             text_color=self.COLORS["text_secondary"],
         )
         icon_label.pack(pady=(40, 10))
-        icon_label.bind("<Button-1>", self._open_file_picker)
 
         title_label = ctk.CTkLabel(
             frame,
             text=self.label,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(16, "bold"),
             text_color=self.COLORS["text_primary"],
         )
         title_label.pack(pady=(0, 5))
-        title_label.bind("<Button-1>", self._open_file_picker)
 
         desc_label = ctk.CTkLabel(
             frame,
             text=self.description,
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=self.COLORS["text_secondary"],
         )
         desc_label.pack(pady=(0, 10))
-        desc_label.bind("<Button-1>", self._open_file_picker)
 
         hint_label = ctk.CTkLabel(
             frame,
             text="Click to select",
-            font=ctk.CTkFont(size=11, slant="italic"),
+            font=get_font(11, slant="italic"),
             text_color=self.COLORS["text_hint"],
         )
         hint_label.pack()
-        hint_label.bind("<Button-1>", self._open_file_picker)
 
-        frame.bind("<Button-1>", self._open_file_picker)
         return frame
 
     def _create_preview(self) -> ctk.CTkFrame:
@@ -128,27 +159,23 @@ class ImagePicker(ctk.CTkFrame):
             height=self._height - 70,
         )
         self._image_label.pack(pady=(10, 5))
-        self._image_label.bind("<Button-1>", self._open_file_picker)
 
         self._filename_label = ctk.CTkLabel(
             frame,
             text="",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             text_color=self.COLORS["text_secondary"],
         )
         self._filename_label.pack(pady=(0, 2))
-        self._filename_label.bind("<Button-1>", self._open_file_picker)
 
         hint_label = ctk.CTkLabel(
             frame,
             text="Click to change",
-            font=ctk.CTkFont(size=10, slant="italic"),
+            font=get_font(10, slant="italic"),
             text_color=self.COLORS["text_hint"],
         )
         hint_label.pack(pady=(0, 8))
-        hint_label.bind("<Button-1>", self._open_file_picker)
 
-        frame.bind("<Button-1>", self._open_file_picker)
         return frame
 
     def _open_file_picker(self, event=None) -> None:
@@ -159,30 +186,50 @@ class ImagePicker(ctk.CTkFrame):
         file_path = filedialog.askopenfilename(
             title=f"Select {self.label}",
             filetypes=self.ALLOWED_EXTENSIONS,
+            initialdir=ImagePicker._last_directory,
         )
 
         if file_path:
             path = Path(file_path)
+            ImagePicker._last_directory = str(path.parent)
             self.set_image(path)
 
             if self.on_image_selected:
                 self.on_image_selected(path)
 
     def set_image(self, path: Path) -> None:
-        """Set the selected image and update preview."""
+        """
+        Set the selected image and update preview.
+
+        The preview is decoded on a background pool and shown when ready.
+        """
         self._selected_path = path
+        self._decode_token += 1
+        token = self._decode_token
 
-        try:
-            pil_image = Image.open(path)
+        max_size = (self._width - 20, self._height - 70)
+        self._image_label.configure(image=None, text="Loading preview...")
+        future = self._DECODE_POOL.submit(_decode_preview, path, max_size)
+        future.add_done_callback(lambda f: self.after(0, self._apply_preview, token, f))
 
-            max_width = self._width - 20
-            max_height = self._height - 70
+        self._filename_label.configure(text=path.name)
+        self.configure(border_color=self.COLORS["border_selected"])
+
+        self._placeholder_frame.pack_forget()
+        self._preview_frame.pack(expand=True, fill="both")
 
-            pil_image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+    def _apply_preview(self, token: int, future: Future) -> None:
+        """Show a decoded preview on the main thread, unless a newer selection replaced it."""
+        if token != self._decode_token:
+            return
+
+        try:
+            pil_image = future.result()
 
+            # The preview looks the same in both appearance modes, so only the light
+            # slot is set; CTkImage falls back to it instead of scaling a second copy
             ctk_image = ctk.CTkImage(
                 light_image=pil_image,
-                dark_image=pil_image,
                 size=(pil_image.width, pil_image.height),
             )
 
@@ -192,14 +239,9 @@ class ImagePicker(ctk.CTkFrame):
         except Exception:
             self._image_label.configure(image=None, text="Preview unavailable")
 
-        self._filename_label.configure(text=path.name)
-        self.configure(border_color=self.COLORS["border_selected"])
-
-        self._placeholder_frame.pack_forget()
-        self._preview_frame.pack(expand=True, fill="both")
-
     def clear_image(self) -> None:
         """Clear the selected image."""
+        self._decode_token += 1
         self._selected_path = None
         self.configure(border_color=self.COLORS["border_default"])
 
@@ -19,7 +19,8 @@ class LogOutput(ctk.CTkFrame):
 
     Lines fed from background threads via feed_line() are batched and
     inserted every _POLL_INTERVAL_MS milliseconds to avoid flooding the
-    Tkinter event loop with individual callbacks.
+    Tkinter event loop with individual callbacks. A poll is only scheduled
+    while lines are pending, so an idle log does no periodic work.
     """
 
     COLORS = {
@@ -41,8 +42,8 @@ class LogOutput(ctk.CTkFrame):
         self._width = width
         self._height = height
         self._queue: queue.Queue = queue.Queue()
+        self._poll_scheduled = False
         self._build()
-        self._poll_queue()
 
     def _build(self) -> None:
         """Build the log output component."""
@@ -66,6 +67,8 @@ class LogOutput(ctk.CTkFrame):
 
     def _poll_queue(self) -> None:
         """Drain the line queue and batch-insert into the textbox."""
+        # Cleared before draining, so a line queued after the drain schedules a new poll
+        self._poll_scheduled = False
         lines = []
         try:
             while True:
@@ -79,8 +82,6 @@ class LogOutput(ctk.CTkFrame):
             self._textbox.configure(state="disabled")
             self._textbox.see("end")
 
-        self.after(self._POLL_INTERVAL_MS, self._poll_queue)
-
     def feed_line(self, text: str) -> None:
         """
         Thread-safe: queue a line for display.
@@ -89,6 +90,9 @@ class LogOutput(ctk.CTkFrame):
         into the textbox on the next poll cycle.
         """
         self._queue.put(text)
+        if not self._poll_scheduled:
+            self._poll_scheduled = True
+            self.after(self._POLL_INTERVAL_MS, self._poll_queue)
 
     def append_line(self, text: str) -> None:
         """
@@ -10,8 +10,34 @@ import sys
 import tkinter as tk
 
 import customtkinter as ctk
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Optional
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
+
+
+@lru_cache(maxsize=64)
+def get_font(size: int, weight: str = "normal", slant: str = "roman") -> ctk.CTkFont:
+    """
+    Get a shared CTkFont for a size, weight and slant.
+
+    Fonts are created on first use (a Tk root must exist) and reused by every
+    widget, so callers must never configure() the returned font.
+    """
+    return ctk.CTkFont(size=size, weight=weight, slant=slant)
+
+
+def add_bindtag(widget, tag: str) -> None:
+    """
+    Give widget and all of its descendants a leading bindtag.
+
+    Tk does not pass events on to parent widgets, so a single bind_class() on
+    the tag then handles events anywhere in the subtree, including the inner
+    canvas/label widgets CustomTkinter creates.
+    """
+    widget.bindtags((tag,) + widget.bindtags())
+    for child in widget.winfo_children():
+        add_bindtag(child, tag)
 
 
 class ThemeColors:
@@ -49,34 +75,38 @@ class ThemeColors:
     INFO_ICON = "#2563eb"
 
     @classmethod
-    def get_colors_dict(cls) -> dict:
-        """Return colors as a dictionary for backward compatibility."""
-        return {
-            "title": cls.TITLE,
-            "subtitle": cls.SUBTITLE,
-            "label": cls.LABEL,
-            "info_text": cls.INFO_TEXT,
-            "panel_bg": cls.PANEL_BG,
-            "panel_border": cls.PANEL_BORDER,
-            "header_bg": cls.HEADER_BG,
-            "header_text": cls.HEADER_TEXT,
-            "status_blue": cls.STATUS_BLUE,
-            "status_green": cls.STATUS_GREEN,
-            "status_red": cls.STATUS_RED,
-            "status_orange": cls.STATUS_ORANGE,
-            "warning": cls.WARNING,
-            "row_bg": cls.ROW_BG,
-            "row_alt_bg": cls.ROW_ALT_BG,
-            "preview_bg": cls.PREVIEW_BG,
-            "info_icon": cls.INFO_ICON,
-            "section_title": cls.LABEL,
-            "converged": cls.STATUS_GREEN,
-            "not_converged": cls.STATUS_RED,
-            "text": cls.LABEL,
-            "summary_green": cls.STATUS_GREEN,
-            "summary_red": cls.STATUS_RED,
-            "summary_blue": cls.STATUS_BLUE,
-        }
+    def get_colors_dict(cls) -> Mapping[str, str]:
+        """Return colors as a read-only mapping for backward compatibility."""
+        return _COLORS_DICT
+
+
+# Built once; read-only because every caller shares the same mapping
+_COLORS_DICT = MappingProxyType({
+    "title": ThemeColors.TITLE,
+    "subtitle": ThemeColors.SUBTITLE,
+    "label": ThemeColors.LABEL,
+    "info_text": ThemeColors.INFO_TEXT,
+    "panel_bg": ThemeColors.PANEL_BG,
+    "panel_border": ThemeColors.PANEL_BORDER,
+    "header_bg": ThemeColors.HEADER_BG,
+    "header_text": ThemeColors.HEADER_TEXT,
+    "status_blue": ThemeColors.STATUS_BLUE,
+    "status_green": ThemeColors.STATUS_GREEN,
+    "status_red": ThemeColors.STATUS_RED,
+    "status_orange": ThemeColors.STATUS_ORANGE,
+    "warning": ThemeColors.WARNING,
+    "row_bg": ThemeColors.ROW_BG,
+    "row_alt_bg": ThemeColors.ROW_ALT_BG,
+    "preview_bg": ThemeColors.PREVIEW_BG,
+    "info_icon": ThemeColors.INFO_ICON,
+    "section_title": ThemeColors.LABEL,
+    "converged": ThemeColors.STATUS_GREEN,
+    "not_converged": ThemeColors.STATUS_RED,
+    "text": ThemeColors.LABEL,
+    "summary_green": ThemeColors.STATUS_GREEN,
+    "summary_red": ThemeColors.STATUS_RED,
+    "summary_blue": ThemeColors.STATUS_BLUE,
+})
 
 
 class PageHeader(ctk.CTkFrame):
@@ -99,7 +129,7 @@ class PageHeader(ctk.CTkFrame):
         self._title_label = ctk.CTkLabel(
             self,
             text=title,
-            font=ctk.CTkFont(size=title_size, weight="bold"),
+            font=get_font(title_size, "bold"),
             text_color=ThemeColors.TITLE,
         )
         self._title_label.pack()
@@ -108,7 +138,7 @@ class PageHeader(ctk.CTkFrame):
             self._subtitle_label = ctk.CTkLabel(
                 self,
                 text=subtitle,
-                font=ctk.CTkFont(size=subtitle_size),
+                font=get_font(subtitle_size),
                 text_color=ThemeColors.SUBTITLE,
             )
             self._subtitle_label.pack(pady=(4, 0))
@@ -167,6 +197,12 @@ class LabeledInputField(ctk.CTkFrame):
     Commonly used for measurement inputs and numeric values.
     """
 
+    # Quiet period after the last keystroke before on_change is called
+    CHANGE_DELAY_MS = 150
+
+    # Partial numbers seen while typing that cannot be parsed yet
+    _INCOMPLETE_INPUT = ("-", ".", "-.")
+
     def __init__(
         self,
         parent: ctk.CTkFrame,
@@ -179,56 +215,85 @@ class LabeledInputField(ctk.CTkFrame):
     ):
         super().__init__(parent, fg_color="transparent")
         self._on_value_change = on_change
+        self._change_after_id = None
 
         self._label = ctk.CTkLabel(
             self,
             text=label,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             text_color=ThemeColors.LABEL,
             width=label_width,
             anchor="w",
         )
-        self._label.pack(side="left")
+        self._label.grid(row=0, column=0)
 
         self._entry_var = ctk.StringVar(value=str(value) if value is not None else "")
         self._entry_var.trace_add("write", self._handle_change)
 
-        entry_frame = ctk.CTkFrame(self, fg_color="transparent")
-        entry_frame.pack(side="left")
-
         self._entry = ctk.CTkEntry(
-            entry_frame,
+            self,
             width=entry_width,
             textvariable=self._entry_var,
             justify="right",
         )
-        self._entry.pack(side="left")
+        self._entry.grid(row=0, column=1)
+        # Leaving the field or pressing Enter reports the edit without waiting for the delay
+        self._entry.bind("<FocusOut>", lambda e: self.flush(), add="+")
+        self._entry.bind("<Return>", lambda e: self.flush(), add="+")
 
         if unit:
             unit_label = ctk.CTkLabel(
-                entry_frame,
+                self,
                 text=unit,
-                font=ctk.CTkFont(size=12),
+                font=get_font(12),
                 text_color=ThemeColors.LABEL,
                 width=25,
             )
-            unit_label.pack(side="left", padx=(5, 0))
+            unit_label.grid(row=0, column=2, padx=(5, 0))
 
     def _handle_change(self, *args) -> None:
-        """Handle value change."""
+        """Handle value change, deferring on_change until typing pauses."""
+        if self._change_after_id is not None:
+            self.after_cancel(self._change_after_id)
+        self._change_after_id = self.after(self.CHANGE_DELAY_MS, self._flush_change)
+
+    def _flush_change(self) -> None:
+        """Parse the entry text and report it to on_change."""
+        self._change_after_id = None
+        text = self._entry_var.get().strip()
+        if text in self._INCOMPLETE_INPUT:
+            return
         try:
-            value = float(self._entry_var.get()) if self._entry_var.get() else None
-            if self._on_value_change:
-                self._on_value_change(value)
+            value = float(text) if text else None
         except ValueError:
-            pass
+            return
+        if self._on_value_change:
+            self._on_value_change(value)
+
+    def flush(self) -> None:
+        """Report a pending edit to on_change now; call before reading the consumer's state."""
+        if self._change_after_id is not None:
+            self.after_cancel(self._change_after_id)
+            self._flush_change()
+
+    def cancel_pending(self) -> None:
+        """Drop a pending edit without reporting it (e.g. when the consumer's state is reset)."""
+        if self._change_after_id is not None:
+            self.after_cancel(self._change_after_id)
+            self._change_after_id = None
+
+    def destroy(self) -> None:
+        """Cancel any pending change callback before destroying the field."""
+        self.cancel_pending()
+        super().destroy()
 
     def set_value(self, value: Optional[float]) -> None:
-        """Set the field value."""
+        """Set the field value, reporting it to on_change immediately."""
         if value is not None:
             self._entry_var.set(f"{value:.1f}")
         else:
             self._entry_var.set("")
+        self.flush()
 
     @property
     def value(self) -> Optional[float]:
@@ -264,25 +329,27 @@ class LabeledDropdown(ctk.CTkFrame):
         super().__init__(parent, fg_color="transparent")
         self._on_change = on_change
 
-        label_frame = ctk.CTkFrame(self, fg_color="transparent")
-        label_frame.pack(anchor="w")
-
+        # Icon and label share the first grid row; the dropdown spans the row below
+        text_column = 0
         if icon:
             icon_label = ctk.CTkLabel(
-                label_frame,
+                self,
                 text=icon,
-                font=ctk.CTkFont(size=13),
+                font=get_font(13),
                 text_color=ThemeColors.LABEL,
             )
-            icon_label.pack(side="left")
+            icon_label.grid(row=0, column=0, sticky="w")
+            text_column = 1
 
         text_label = ctk.CTkLabel(
-            label_frame,
+            self,
             text=label,
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=ThemeColors.LABEL,
         )
-        text_label.pack(side="left", padx=(4 if icon else 0, 0))
+        text_label.grid(row=0, column=text_column, sticky="w", padx=(4 if icon else 0, 0))
+        # Extra width from the wider dropdown goes to the label column, keeping the icon snug
+        self.grid_columnconfigure(text_column, weight=1)
 
         self._var = ctk.StringVar(value="")
         self._dropdown = ctk.CTkOptionMenu(
@@ -294,7 +361,7 @@ class LabeledDropdown(ctk.CTkFrame):
             command=self._handle_change,
         )
         self._dropdown.set(placeholder)
-        self._dropdown.pack(anchor="w", pady=(2, 0))
+        self._dropdown.grid(row=1, column=0, columnspan=2, sticky="w", pady=(2, 0))
 
     def _handle_change(self, value: str) -> None:
         """Handle selection change."""
@@ -337,7 +404,7 @@ class IconLabel(ctk.CTkFrame):
         self._icon_label = ctk.CTkLabel(
             self,
             text=icon,
-            font=ctk.CTkFont(size=font_size),
+            font=get_font(font_size),
             text_color=icon_color or ThemeColors.LABEL,
         )
         self._icon_label.pack(side="left")
@@ -345,7 +412,7 @@ class IconLabel(ctk.CTkFrame):
         self._text_label = ctk.CTkLabel(
             self,
             text=text,
-            font=ctk.CTkFont(size=font_size),
+            font=get_font(font_size),
             text_color=text_color or ThemeColors.LABEL,
         )
         self._text_label.pack(side="left", padx=(4, 0))
@@ -376,6 +443,14 @@ class StatusBadge(ctk.CTkFrame):
         "processing": "\u25CF",
     }
 
+    # status -> (icon, icon color); unknown statuses fall back to "pending"
+    _STATUS_STYLES = {
+        "valid": (ICONS["valid"], ThemeColors.STATUS_GREEN),
+        "invalid": (ICONS["invalid"], ThemeColors.STATUS_RED),
+        "pending": (ICONS["pending"], ThemeColors.SUBTITLE),
+        "processing": (ICONS["processing"], ThemeColors.STATUS_BLUE),
+    }
+
     def __init__(
         self,
         parent: ctk.CTkFrame,
@@ -388,7 +463,7 @@ class StatusBadge(ctk.CTkFrame):
         self._icon_label = ctk.CTkLabel(
             self,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             width=16,
         )
         self._icon_label.pack(side="left")
@@ -396,7 +471,7 @@ class StatusBadge(ctk.CTkFrame):
         self._text_label = ctk.CTkLabel(
             self,
             text=label,
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=ThemeColors.LABEL,
         )
         self._text_label.pack(side="left", padx=(4, 0))
@@ -405,29 +480,11 @@ class StatusBadge(ctk.CTkFrame):
 
     def set_valid(self, is_valid: bool) -> None:
         """Update the validity state."""
-        if is_valid:
-            self._icon_label.configure(
-                text=self.ICONS["valid"],
-                text_color=ThemeColors.STATUS_GREEN,
-            )
-        else:
-            self._icon_label.configure(
-                text=self.ICONS["invalid"],
-                text_color=ThemeColors.STATUS_RED,
-            )
+        self.set_status("valid" if is_valid else "invalid")
 
     def set_status(self, status: str) -> None:
         """Set status to: valid, invalid, pending, or processing."""
-        icon = self.ICONS.get(status, self.ICONS["pending"])
-        if status == "valid":
-            color = ThemeColors.STATUS_GREEN
-        elif status == "invalid":
-            color = ThemeColors.STATUS_RED
-        elif status == "processing":
-            color = ThemeColors.STATUS_BLUE
-        else:
-            color = ThemeColors.SUBTITLE
-
+        icon, color = self._STATUS_STYLES.get(status, self._STATUS_STYLES["pending"])
         self._icon_label.configure(text=icon, text_color=color)
 
 
@@ -456,7 +513,7 @@ class ActionButton(ctk.CTkButton):
         super().__init__(
             parent,
             text=text,
-            font=ctk.CTkFont(size=font_size, weight=font_weight),
+            font=get_font(font_size, font_weight),
             width=width,
             height=height,
             command=command,
@@ -510,7 +567,7 @@ class SectionTitle(ctk.CTkLabel):
         super().__init__(
             parent,
             text=text,
-            font=ctk.CTkFont(size=font_size, weight="bold"),
+            font=get_font(font_size, "bold"),
             text_color=ThemeColors.LABEL,
         )
 
@@ -522,6 +579,12 @@ class StatusLabel(ctk.CTkLabel):
     Used for showing operation status, errors, or success messages.
     """
 
+    STATUS_COLORS = {
+        "success": ThemeColors.STATUS_GREEN,
+        "error": ThemeColors.STATUS_RED,
+        "info": ThemeColors.STATUS_BLUE,
+    }
+
     def __init__(
         self,
         parent: ctk.CTkFrame,
@@ -532,19 +595,13 @@ class StatusLabel(ctk.CTkLabel):
         super().__init__(
             parent,
             text=text,
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=color,
         )
 
     def _get_color(self, status: str) -> str:
         """Get color for status type."""
-        if status == "success":
-            return ThemeColors.STATUS_GREEN
-        elif status == "error":
-            return ThemeColors.STATUS_RED
-        elif status == "info":
-            return ThemeColors.STATUS_BLUE
-        return ThemeColors.SUBTITLE
+        return self.STATUS_COLORS.get(status, ThemeColors.SUBTITLE)
 
     def set_status(self, text: str, status: str = "info") -> None:
         """Update the status message and color."""
@@ -717,7 +774,7 @@ class FilePicker(ctk.CTkFrame):
             label_widget = ctk.CTkLabel(
                 self,
                 text=label,
-                font=ctk.CTkFont(size=13),
+                font=get_font(13),
                 text_color=ThemeColors.SUBTITLE,
             )
             label_widget.pack(anchor="w")
@@ -798,7 +855,7 @@ class FolderPicker(ctk.CTkFrame):
             label_widget = ctk.CTkLabel(
                 self,
                 text=label,
-                font=ctk.CTkFont(size=13),
+                font=get_font(13),
                 text_color=ThemeColors.SUBTITLE,
             )
             label_widget.pack(anchor="w")
@@ -886,7 +943,7 @@ class SummaryPanel(ctk.CTkFrame):
         self._content_label = ctk.CTkLabel(
             self._content_frame,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=ThemeColors.LABEL,
             justify="left",
             wraplength=width - 30,
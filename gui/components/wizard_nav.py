@@ -8,6 +8,7 @@ import customtkinter as ctk
 from typing import Callable, Optional
 
 from ..app_state import AppState, WizardStep
+from .ui_elements import add_bindtag, get_font
 
 
 class WizardNav(ctk.CTkFrame):
@@ -40,6 +41,13 @@ class WizardNav(ctk.CTkFrame):
         "other_label": "#6b7280",
     }
 
+    # (is_completed, is_current) -> (circle bg, circle text color, label color)
+    _STATE_COLORS = {
+        (True, False): (COLORS["completed_bg"], COLORS["completed_fg"], COLORS["other_label"]),
+        (False, True): (COLORS["current_bg"], COLORS["current_fg"], COLORS["current_label"]),
+        (False, False): (COLORS["upcoming_bg"], COLORS["upcoming_fg"], COLORS["other_label"]),
+    }
+
     def __init__(
         self,
         parent: ctk.CTkFrame,
@@ -49,105 +57,102 @@ class WizardNav(ctk.CTkFrame):
         super().__init__(parent, fg_color="transparent")
         self.app_state = app_state
         self.on_step_click = on_step_click
-        self._indicator_widgets: list = []
+        # Circle and label widgets per step, built once and reconfigured on step changes
+        self._indicators: dict[WizardStep, tuple[ctk.CTkLabel, ctk.CTkLabel]] = {}
+        # Widget path of each clickable circle/label -> its step, for the shared click binding
+        self._click_targets: dict[str, WizardStep] = {}
+        # Last (is_completed, is_current) applied to each indicator, to skip unchanged ones
+        self._indicator_states: dict[WizardStep, tuple[bool, bool]] = {}
         self._last_rendered_step = None
         self._build()
 
     def _build(self) -> None:
         """Build the navigation component."""
-        self._create_step_indicators()
-        self._last_rendered_step = self.app_state.current_step
-
-    def _create_step_indicators(self) -> None:
-        """Create step indicator controls."""
-        for widget in self._indicator_widgets:
-            widget.destroy()
-        self._indicator_widgets.clear()
-
-        for child in self.winfo_children():
-            child.destroy()
+        # One class binding serves every indicator; see add_bindtag
+        self._click_tag = f"WizardNavClick{self}"
+        self.bind_class(self._click_tag, "<Button-1>", self._on_indicator_click)
 
         container = ctk.CTkFrame(self, fg_color="transparent")
         container.pack(pady=20, padx=10)
 
-        steps = list(WizardStep)
-
-        for i, step in enumerate(steps):
-            is_current = step == self.app_state.current_step
-            is_completed = step.value < self.app_state.current_step.value
-            # Only current step is clickable (linear workflow)
-            is_clickable = is_current
-
-            indicator = self._create_step_indicator(
-                parent=container,
-                step=step,
-                number=i + 1,
-                is_current=is_current,
-                is_completed=is_completed,
-                is_clickable=is_clickable,
-            )
+        for i, step in enumerate(WizardStep):
+            indicator = self._create_step_indicator(parent=container, step=step, number=i + 1)
             indicator.pack(side="left", padx=15)
-            self._indicator_widgets.append(indicator)
+
+        self._refresh_indicators()
+        self._last_rendered_step = self.app_state.current_step
 
     def _create_step_indicator(
         self,
         parent: ctk.CTkFrame,
         step: WizardStep,
         number: int,
-        is_current: bool,
-        is_completed: bool,
-        is_clickable: bool,
     ) -> ctk.CTkFrame:
-        """Create a single step indicator."""
+        """Create a single step indicator; its colors are set by _refresh_indicators."""
         frame = ctk.CTkFrame(parent, fg_color="transparent")
 
-        if is_completed:
-            bg_color = self.COLORS["completed_bg"]
-            text = str(number)
-            text_color = self.COLORS["completed_fg"]
-        elif is_current:
-            bg_color = self.COLORS["current_bg"]
-            text = str(number)
-            text_color = self.COLORS["current_fg"]
-        else:
-            bg_color = self.COLORS["upcoming_bg"]
-            text = str(number)
-            text_color = self.COLORS["upcoming_fg"]
-
         # Create checkpoint circle without border
         circle = ctk.CTkLabel(
             frame,
-            text=text,
+            text=str(number),
             width=36,
             height=36,
             corner_radius=18,
-            fg_color=bg_color,
-            text_color=text_color,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
         )
         circle.pack()
 
-        label_color = self.COLORS["current_label"] if is_current else self.COLORS["other_label"]
-        label_weight = "bold" if is_current else "normal"
-
         label = ctk.CTkLabel(
             frame,
             text=self.STEP_LABELS[step],
-            font=ctk.CTkFont(size=12, weight=label_weight),
-            text_color=label_color,
+            font=get_font(12),
         )
         label.pack(pady=(8, 0))
 
-        if is_clickable:
-            circle.bind("<Button-1>", lambda e, s=step: self._handle_step_click(s))
-            label.bind("<Button-1>", lambda e, s=step: self._handle_step_click(s))
-            circle.configure(cursor="hand2")
-            label.configure(cursor="hand2")
+        for widget in (circle, label):
+            self._click_targets[str(widget)] = step
+            add_bindtag(widget, self._click_tag)
 
+        self._indicators[step] = (circle, label)
         return frame
 
+    def _on_indicator_click(self, event) -> None:
+        """Find the indicator that was clicked and dispatch its step."""
+        widget = event.widget
+        while widget is not None and widget is not self:
+            step = self._click_targets.get(str(widget))
+            if step is not None:
+                self._handle_step_click(step)
+                return
+            widget = widget.master
+
+    def _refresh_indicators(self) -> None:
+        """Recolor the step indicators whose state changed since the last refresh."""
+        current_step = self.app_state.current_step
+
+        for step, (circle, label) in self._indicators.items():
+            is_current = step == current_step
+            is_completed = step.value < current_step.value
+            state = (is_completed, is_current)
+            if self._indicator_states.get(step) == state:
+                continue
+            self._indicator_states[step] = state
+            bg_color, text_color, label_color = self._STATE_COLORS[state]
+
+            # Only current step is clickable (linear workflow)
+            cursor = "hand2" if is_current else ""
+
+            circle.configure(fg_color=bg_color, text_color=text_color, cursor=cursor)
+            label.configure(
+                text_color=label_color,
+                font=get_font(12, "bold") if is_current else get_font(12),
+                cursor=cursor,
+            )
+
     def _handle_step_click(self, step: WizardStep) -> None:
         """Handle click on a step indicator."""
+        if step != self.app_state.current_step:
+            return
         if self.on_step_click:
             self.on_step_click(step)
 
@@ -156,4 +161,4 @@ class WizardNav(ctk.CTkFrame):
         if self.app_state.current_step == self._last_rendered_step:
             return
         self._last_rendered_step = self.app_state.current_step
-        self._create_step_indicators()
+        self._refresh_indicators()
@@ -6,8 +6,27 @@ Contains the main feature views:
 - AvatarGenerationView: Avatar generation wizard flow
 """
 
-from .camera_calibration import CameraCalibrationView
-from .avatar_generation import AvatarGenerationView
-from .animation_baker import AnimationBakerView
+from importlib import import_module
+
+# View name -> submodule; views are imported on first access (PEP 562) so
+# importing one feature module does not load the others
+_LAZY_VIEWS = {
+    "CameraCalibrationView": ".camera_calibration",
+    "AvatarGenerationView": ".avatar_generation",
+    "AnimationBakerView": ".animation_baker",
+}
 
 __all__ = ["CameraCalibrationView", "AvatarGenerationView", "AnimationBakerView"]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_VIEWS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    view = getattr(import_module(module_name, __name__), name)
+    globals()[name] = view
+    return view
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -9,7 +9,7 @@ from pathlib import Path
 
 from PIL import Image
 
-from ..app_state import AppState
+from ..app_state import AppState, marker_position
 from ..components.ui_elements import (
     ThemeColors,
     PageHeader,
@@ -33,7 +33,8 @@ class ArucoSettingsView(ctk.CTkFrame):
         self.app_state = app_state
 
         self._build()
-        self._load_existing_settings()
+        # Deferred until the event loop runs so building the view stays cheap
+        self.after_idle(self._load_existing_settings)
 
     def _build(self) -> None:
         """Build the view content."""
@@ -240,13 +241,12 @@ class ArucoSettingsView(ctk.CTkFrame):
         return x_var, y_var
 
     def _load_existing_settings(self) -> None:
-        """Load and display existing settings from marker_details.json."""
-        state = self.app_state.aruco_settings
-        if state.load_from_file():
-            self._populate_input_fields()
+        """Load existing settings from marker_details.json and display them."""
+        loaded = self.app_state.aruco_settings.load_from_file()
+        self._populate_input_fields()
+        if loaded:
             self._status_label.set_info("Loaded from: marker_details.json")
         else:
-            self._populate_input_fields()
             self._status_label.set_info("Using default settings (no configuration file found)")
 
     def _populate_input_fields(self) -> None:
@@ -268,19 +268,30 @@ class ArucoSettingsView(ctk.CTkFrame):
         state = self.app_state.aruco_settings
 
         try:
-            state.marker_size_cm = float(self._marker_size_var.get())
-            state.top_left.x = float(self._top_left_x_var.get())
-            state.top_left.y = float(self._top_left_y_var.get())
-            state.top_right.x = float(self._top_right_x_var.get())
-            state.top_right.y = float(self._top_right_y_var.get())
-            state.bottom_left.x = float(self._bottom_left_x_var.get())
-            state.bottom_left.y = float(self._bottom_left_y_var.get())
-            state.bottom_right.x = float(self._bottom_right_x_var.get())
-            state.bottom_right.y = float(self._bottom_right_y_var.get())
+            marker_size_cm = float(self._marker_size_var.get())
+            top_left = marker_position(
+                float(self._top_left_x_var.get()), float(self._top_left_y_var.get())
+            )
+            top_right = marker_position(
+                float(self._top_right_x_var.get()), float(self._top_right_y_var.get())
+            )
+            bottom_left = marker_position(
+                float(self._bottom_left_x_var.get()), float(self._bottom_left_y_var.get())
+            )
+            bottom_right = marker_position(
+                float(self._bottom_right_x_var.get()), float(self._bottom_right_y_var.get())
+            )
         except ValueError:
             self._status_label.set_error("Error: Please enter valid numbers")
             return
 
+        # MarkerPosition is immutable, so replace each corner wholesale
+        state.marker_size_cm = marker_size_cm
+        state.top_left = top_left
+        state.top_right = top_right
+        state.bottom_left = bottom_left
+        state.bottom_right = bottom_right
+
         if state.save_to_file():
             self._status_label.set_success("Configuration updated successfully")
         else:
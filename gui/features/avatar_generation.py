@@ -45,7 +45,8 @@ class AvatarGenerationView(ctk.CTkFrame):
         self._create_steps()
         self._build()
 
-        self.app_state.set_on_state_change(self._on_state_change)
+        self.app_state.set_idle_scheduler(self.after_idle)
+        self.app_state.subscribe("current_step", self._on_state_change)
 
     def _create_steps(self) -> None:
         """Create step views."""
@@ -4,8 +4,10 @@ Camera Calibration Feature View
 Provides UI for camera calibration using checkerboard pattern images.
 """
 
+import json
 import customtkinter as ctk
 from tkinter import filedialog
+from concurrent.futures import Future
 from pathlib import Path
 import threading
 
@@ -283,20 +285,27 @@ class CameraCalibrationView(ctk.CTkFrame):
             return "Poor"
 
     def _load_existing_calibration(self) -> None:
-        """Load and display existing calibration if available."""
-        import json
-
-        output_path = self.app_state.camera_calibration.get_output_path()
-        if not output_path.exists():
-            return
+        """Load existing calibration metadata in the background and display it."""
+        thread = threading.Thread(target=self._run_load_existing_calibration, daemon=True)
+        thread.start()
 
+    def _run_load_existing_calibration(self) -> None:
+        """Read calibration.json in a background thread."""
         try:
-            with open(output_path) as f:
-                data = json.load(f)
+            data = self.app_state.camera_calibration.load_existing_calibration()
+        except (json.JSONDecodeError, OSError):
+            return
+        if data is not None:
+            self.after(0, lambda: self._show_existing_calibration(data))
 
-            if not data.get("success"):
-                return
+    def _show_existing_calibration(self, data: dict) -> None:
+        """Display a previously saved calibration on the main thread."""
+        state = self.app_state.camera_calibration
+        # A calibration started before the file finished loading takes precedence
+        if state.is_calibrating or state.calibration_success is not None:
+            return
 
+        try:
             reprojection_error = data.get("reprojection_error")
             num_successful = data.get("num_successful_images", 0)
             num_failed = data.get("num_failed_images", 0)
@@ -325,9 +334,9 @@ class CameraCalibrationView(ctk.CTkFrame):
                 text_color=quality_color,
             )
             self._results_output_label.configure(
-                text=f"Loaded from: {output_path.name}",
+                text=f"Loaded from: {state.get_output_path().name}",
             )
-        except (json.JSONDecodeError, KeyError):
+        except KeyError:
             pass
 
     def _open_folder_picker(self) -> None:
@@ -389,20 +398,21 @@ class CameraCalibrationView(ctk.CTkFrame):
         self._results_quality_label.configure(text="")
         self._results_output_label.configure(text="")
 
-        thread = threading.Thread(target=self._run_calibration)
-        thread.start()
+        state = self.app_state.camera_calibration
+        future = self.backend.calibrate_camera_async(
+            image_dir=state.image_directory,
+            checkerboard_size=(state.checkerboard_cols, state.checkerboard_rows),
+            square_size_mm=state.square_size_mm,
+            output_path=state.get_output_path(),
+        )
+        future.add_done_callback(self._on_calibration_done)
 
-    def _run_calibration(self) -> None:
-        """Run calibration in background thread."""
+    def _on_calibration_done(self, future: Future) -> None:
+        """Record the calibration result and hand completion back to the main thread."""
         state = self.app_state.camera_calibration
 
         try:
-            result = self.backend.calibrate_camera(
-                image_dir=state.image_directory,
-                checkerboard_size=(state.checkerboard_cols, state.checkerboard_rows),
-                square_size_mm=state.square_size_mm,
-                output_path=state.get_output_path(),
-            )
+            result = future.result()
 
             state.calibration_success = result.get("success", False)
             state.reprojection_error = result.get("reprojection_error")
@@ -0,0 +1,61 @@
+"""
+JSON file helpers shared by the application state and the backend interface.
+
+Uses orjson when it is installed and falls back to the standard library json
+module otherwise. Output is 2-space indented, or compact for files only read
+by scripts. It is always ASCII, with non-ASCII text escaped as \\uXXXX like the
+standard library's default, because the submodule and Blender scripts that
+read these files may decode them with the platform's locale encoding. The two
+encoders can still differ in float formatting, so the bytes are equivalent
+JSON rather than identical. orjson's decode error subclasses
+json.JSONDecodeError, so callers only need to catch the standard library
+exception.
+"""
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def loads(data: bytes):
+    """Decode JSON bytes."""
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent: bool = True) -> bytes:
+    """Encode an object as ASCII JSON bytes, 2-space indented or (indent=False) compact."""
+    if _ORJSON_AVAILABLE:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+        # orjson always writes raw UTF-8; anything non-ASCII (e.g. a user's folder
+        # path) goes through the stdlib encoder so it is escaped
+        if data.isascii():
+            return data
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def read_json(path: Path):
+    """Read and decode a JSON file in a single read."""
+    return loads(Path(path).read_bytes())
+
+
+def write_json(path: Path, obj, indent: bool = True) -> None:
+    """
+    Encode obj and write it to path, indented unless indent is False.
+
+    The data goes to a sibling temp file that then atomically replaces path,
+    so readers never see a half-written file.
+    """
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(dumps(obj, indent))
+    os.replace(tmp_path, path)
@@ -17,7 +17,6 @@ except ImportError:
 
 from .app_state import AppState
 from .backend_interface import get_backend
-from .features.camera_calibration import CameraCalibrationView
 from .features.aruco_settings import ArucoSettingsView
 from .features.avatar_generation import AvatarGenerationView
 from .features.c3d_converter import C3dConverterView
@@ -38,6 +37,22 @@ class AvatarGeneratorApp(ctk.CTk):
 
     COLORS: dict = {}
 
+    TAB_CAMERA_CALIBRATION = "Camera Calibration"
+    TAB_ARUCO_SETTINGS = "ArUco Settings"
+    TAB_C3D_CONVERTER = "C3D Converter"
+    TAB_ANIMATION_BAKER = "Animation Baker"
+    TAB_AVATAR_GENERATION = "Avatar Generation"
+
+    # Tab bar order (left to right) and the tab shown on startup
+    TAB_ORDER = (
+        TAB_CAMERA_CALIBRATION,
+        TAB_ARUCO_SETTINGS,
+        TAB_C3D_CONVERTER,
+        TAB_ANIMATION_BAKER,
+        TAB_AVATAR_GENERATION,
+    )
+    INITIAL_TAB = TAB_AVATAR_GENERATION
+
     def __init__(self):
         super().__init__()
 
@@ -62,45 +77,37 @@ class AvatarGeneratorApp(ctk.CTk):
         self._tabview = ctk.CTkTabview(self)
         self._tabview.pack(expand=True, fill="both", padx=0, pady=0)
 
-        self._tabview.add("Camera Calibration")
-        self._tabview.add("ArUco Settings")
-        self._tabview.add("C3D Converter")
-        self._tabview.add("Animation Baker")
-        self._tabview.add("Avatar Generation")
+        for tab_name in self.TAB_ORDER:
+            self._tabview.add(tab_name)
 
-        self._tabview.set("Avatar Generation")
+        self._tabview.set(self.INITIAL_TAB)
         self._tabview.configure(command=self._on_tab_change)
 
-        calibration_tab = self._tabview.tab("Camera Calibration")
-        self._camera_calibration = CameraCalibrationView(
-            calibration_tab,
-            self.app_state,
-            self.backend,
-        )
-        self._camera_calibration.pack(expand=True, fill="both")
+        # Built on first visit to the tab (see _ensure_camera_calibration)
+        self._camera_calibration = None
 
-        aruco_tab = self._tabview.tab("ArUco Settings")
+        aruco_tab = self._tabview.tab(self.TAB_ARUCO_SETTINGS)
         self._aruco_settings = ArucoSettingsView(
             aruco_tab,
             self.app_state,
         )
         self._aruco_settings.pack(expand=True, fill="both")
 
-        c3d_tab = self._tabview.tab("C3D Converter")
+        c3d_tab = self._tabview.tab(self.TAB_C3D_CONVERTER)
         self._c3d_converter = C3dConverterView(
             c3d_tab,
             set_tabs_locked=self.set_tabs_locked,
         )
         self._c3d_converter.pack(expand=True, fill="both")
 
-        animation_baker_tab = self._tabview.tab("Animation Baker")
+        animation_baker_tab = self._tabview.tab(self.TAB_ANIMATION_BAKER)
         self._animation_baker = AnimationBakerView(
             animation_baker_tab,
             set_tabs_locked=self.set_tabs_locked,
         )
         self._animation_baker.pack(expand=True, fill="both")
 
-        generation_tab = self._tabview.tab("Avatar Generation")
+        generation_tab = self._tabview.tab(self.TAB_AVATAR_GENERATION)
         self._avatar_generation = AvatarGenerationView(
             generation_tab,
             self.app_state,
@@ -109,18 +116,35 @@ class AvatarGeneratorApp(ctk.CTk):
         )
         self._avatar_generation.pack(expand=True, fill="both")
 
+    def _ensure_camera_calibration(self) -> None:
+        """Build the Camera Calibration view the first time its tab is opened."""
+        if self._camera_calibration is not None:
+            return
+        from .features.camera_calibration import CameraCalibrationView
+
+        calibration_tab = self._tabview.tab(self.TAB_CAMERA_CALIBRATION)
+        self._camera_calibration = CameraCalibrationView(
+            calibration_tab,
+            self.app_state,
+            self.backend,
+        )
+        self._camera_calibration.pack(expand=True, fill="both")
+        self._fix_widget_flicker(self._camera_calibration)
+
     def _fix_minimize_flicker(self) -> None:
         """Apply pywinstyles opacity fix to prevent widget flickering on minimize/restore."""
-        if not _PYWINSTYLES_AVAILABLE:
-            return
         for widget in [
             self._tabview,
-            self._camera_calibration,
             self._aruco_settings,
             self._c3d_converter,
             self._animation_baker,
             self._avatar_generation,
         ]:
+            self._fix_widget_flicker(widget)
+
+    def _fix_widget_flicker(self, widget) -> None:
+        """Apply the pywinstyles opacity fix to a single widget, if available."""
+        if _PYWINSTYLES_AVAILABLE:
             pywinstyles.set_opacity(widget, value=1.0)
 
     def set_tabs_locked(self, locked: bool) -> None:
@@ -129,8 +153,11 @@ class AvatarGeneratorApp(ctk.CTk):
         self._tabview._segmented_button.configure(state=state)
 
     def _on_tab_change(self) -> None:
-        """Refresh the active wizard step when switching back to Avatar Generation."""
-        if self._tabview.get() == "Avatar Generation":
+        """Build lazy views on first visit and refresh the wizard on return to Avatar Generation."""
+        tab = self._tabview.get()
+        if tab == self.TAB_CAMERA_CALIBRATION:
+            self._ensure_camera_calibration()
+        elif tab == self.TAB_AVATAR_GENERATION:
             self._avatar_generation.on_tab_enter()
 
 
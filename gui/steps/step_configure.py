@@ -246,7 +246,7 @@ class StepConfigure(ctk.CTkFrame):
         """Handle rig type change."""
         rig_value = self.RIG_OPTIONS[value]
         self.app_state.configure.rig_type = RigType(rig_value)
-        self.app_state.notify_change()
+        self.app_state.notify_change("configure")
 
     def _on_hair_change(self, value: str) -> None:
         """Handle hair asset change."""
@@ -256,12 +256,12 @@ class StepConfigure(ctk.CTkFrame):
         )
         self.app_state.configure.hair_asset = hair_asset
         self._update_preview()
-        self.app_state.notify_change()
+        self.app_state.notify_change("configure")
 
     def _on_bvh_selected(self, file_path: Path) -> None:
         """Handle BVH animation file selection."""
         self.app_state.configure.bvh_animation_path = file_path
-        self.app_state.notify_change()
+        self.app_state.notify_change("configure")
 
     def on_enter(self) -> None:
         """Called when entering this step."""
@@ -195,7 +195,7 @@ class StepGenerate(ctk.CTkFrame):
             print(f"[DEBUG] Generation complete, result: {result}")
             self.app_state.generate.output_fbx_path = result.get("fbx_path")
             self.app_state.generate.output_obj_path = result.get("obj_path")
-            self.app_state.generate.preview_images = result.get("preview_images", [])
+            self.app_state.generate.preview_images = tuple(result.get("preview_images", ()))
 
             print("[DEBUG] Calling _on_generation_complete...")
             self.after(0, self._on_generation_complete)
@@ -218,7 +218,7 @@ class StepGenerate(ctk.CTkFrame):
         if self.app_state.generate.preview_images:
             self._show_preview(self.app_state.generate.preview_images[0])
 
-        self.app_state.notify_change()
+        self.app_state.notify_change("generate")
 
     def _on_generation_error(self, error: str) -> None:
         """Handle generation error."""
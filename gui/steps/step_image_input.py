@@ -5,9 +5,9 @@ Allows the user to select a front photograph, enter height, and extract measurem
 """
 
 import customtkinter as ctk
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Callable, Optional
-import threading
 
 from ..app_state import AppState
 from ..backend_interface import BackendInterface
@@ -195,7 +195,7 @@ class StepImageInput(ctk.CTkFrame):
         """Handle front image selection."""
         self.app_state.image_input.front_image_path = path
         self._update_validation()
-        self.app_state.notify_change()
+        self.app_state.notify_change("image_input")
 
     def _on_height_change(self, *args) -> None:
         """Handle height value change."""
@@ -205,7 +205,7 @@ class StepImageInput(ctk.CTkFrame):
         except ValueError:
             self.app_state.image_input.height_cm = None
         self._update_validation()
-        self.app_state.notify_change()
+        self.app_state.notify_change("image_input")
 
     def _on_gender_change(self, value: str) -> None:
         """Handle gender selection change."""
@@ -214,7 +214,7 @@ class StepImageInput(ctk.CTkFrame):
         else:
             self.app_state.image_input.gender = None
         self._update_validation()
-        self.app_state.notify_change()
+        self.app_state.notify_change("image_input")
 
     def _on_race_change(self, value: str) -> None:
         """Handle race selection change."""
@@ -223,7 +223,7 @@ class StepImageInput(ctk.CTkFrame):
         else:
             self.app_state.image_input.race = None
         self._update_validation()
-        self.app_state.notify_change()
+        self.app_state.notify_change("image_input")
 
     def _update_config_status(self) -> None:
         """Update configuration validity in app state."""
@@ -278,26 +278,27 @@ class StepImageInput(ctk.CTkFrame):
         self._height_entry.configure(state="disabled")
         self._extract_button.start_processing("Extracting Measurements...")
         self._status_label.set_info("Extracting measurements...")
-        self.app_state.notify_change()
-
-        thread = threading.Thread(target=self._run_extraction)
-        thread.start()
+        self.app_state.notify_change("image_input")
+
+        future = self.backend.extract_measurements_async(
+            front_image=self.app_state.image_input.front_image_path,
+            height_cm=self.app_state.image_input.height_cm,
+            camera_calibration_path=self.app_state.camera_calibration.get_output_path(),
+            marker_details_path=self.app_state.aruco_settings.get_config_path(),
+            gender=self.app_state.image_input.gender,
+            race=self.app_state.image_input.race,
+        )
+        future.add_done_callback(self._on_extraction_done)
 
-    def _run_extraction(self) -> None:
-        """Run extraction in background thread."""
+    def _on_extraction_done(self, future: Future) -> None:
+        """Hand the finished extraction back to the main thread."""
         try:
-            result = self.backend.extract_measurements(
-                front_image=self.app_state.image_input.front_image_path,
-                height_cm=self.app_state.image_input.height_cm,
-                camera_calibration_path=self.app_state.camera_calibration.get_output_path(),
-                marker_details_path=self.app_state.aruco_settings.get_config_path(),
-                gender=self.app_state.image_input.gender,
-                race=self.app_state.image_input.race,
-            )
-            self.after(0, lambda: self._on_extraction_complete(result))
+            result = future.result()
         except Exception as e:
             error_msg = str(e)
             self.after(0, lambda: self._on_extraction_error(error_msg))
+            return
+        self.after(0, lambda: self._on_extraction_complete(result))
 
     def _on_extraction_complete(self, result: dict) -> None:
         """Handle extraction completion on main thread."""
@@ -337,7 +338,9 @@ class StepImageInput(ctk.CTkFrame):
         # Change button to "Review Measurements" mode
         self._extract_button.stop_processing("Review Measurements", self._go_to_review)
         self._status_label.set_success("Measurements extracted successfully!")
-        self.app_state.notify_change()
+        with self.app_state.batch_updates():
+            self.app_state.notify_change("image_input")
+            self.app_state.notify_change("measurements")
 
     def _on_extraction_error(self, error_message: str) -> None:
         """Handle extraction error on main thread."""
@@ -352,7 +355,7 @@ class StepImageInput(ctk.CTkFrame):
 
         self._extract_button.stop_processing()
         self._status_label.set_error(f"Error: {error_message}")
-        self.app_state.notify_change()
+        self.app_state.notify_change("image_input")
 
     def _go_to_review(self) -> None:
         """Navigate to the measurements review step."""
@@ -4,7 +4,6 @@ Step 2: Measurements Review
 Displays extracted measurements with visualization and allows manual corrections.
 """
 
-import json
 import customtkinter as ctk
 from typing import Callable, Optional
 from PIL import Image
@@ -12,6 +11,7 @@ import threading
 
 from ..app_state import AppState
 from ..backend_interface import BackendInterface
+from ..json_io import read_json, write_json
 from ..components.ui_elements import (
     ThemeColors,
     PageHeader,
@@ -241,15 +241,21 @@ class StepMeasurements(ctk.CTkFrame):
         """Handle field value change."""
         setattr(self.app_state.measurements, field_name, value)
         self.app_state.measurements.is_manually_edited = True
-        self.app_state.notify_change()
+        self.app_state.notify_change(f"measurements.{field_name}")
 
     def _on_retake_click(self) -> None:
         """Navigate back to image input to retake the photo."""
+        # Edits still waiting on the field debounce belong to the state being discarded
+        for field in self._fields.values():
+            field.cancel_pending()
         if self.on_navigate_back:
             self.on_navigate_back()
 
     def _compute_parameters(self) -> None:
         """Start the mesh parameter computation process."""
+        # Apply edits still waiting on the field debounce before the state is read
+        for field in self._fields.values():
+            field.flush()
         self._retake_button.pack_forget()
         if self._set_tabs_locked:
             self._set_tabs_locked(True)
@@ -261,7 +267,7 @@ class StepMeasurements(ctk.CTkFrame):
         # Disable button and show processing state
         self._configure_button.start_processing("Configuring Mesh...")
         self._status_label.set_info("This process will take 2-3 minutes")
-        self.app_state.notify_change()
+        self.app_state.notify_change("measurements")
 
         thread = threading.Thread(target=self._run_parameter_computation)
         thread.start()
@@ -276,8 +282,7 @@ class StepMeasurements(ctk.CTkFrame):
         if not measurements_path.exists():
             return
 
-        with open(measurements_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json(measurements_path)
 
         body = data.get("body_measurements", {})
         m = self.app_state.measurements
@@ -293,8 +298,7 @@ class StepMeasurements(ctk.CTkFrame):
                 body.pop(field_name, None)
 
         data["body_measurements"] = body
-        with open(measurements_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        write_json(measurements_path, data, indent=False)
 
     def _run_parameter_computation(self) -> None:
         """Run parameter computation in background thread."""
@@ -333,7 +337,7 @@ class StepMeasurements(ctk.CTkFrame):
         self._status_label.set_success(
             f"{converged}/{total} measurements converged, Mean error: {mean_error:.2f}cm"
         )
-        self.app_state.notify_change()
+        self.app_state.notify_change("measurements")
 
     def _navigate_to_accuracy_review(self) -> None:
         """Navigate to the Accuracy Review step."""
@@ -356,7 +360,7 @@ class StepMeasurements(ctk.CTkFrame):
         # Show error message
         error_text = f"Error: {error_message[:80]}..." if len(error_message) > 80 else f"Error: {error_message}"
         self._status_label.set_error(error_text)
-        self.app_state.notify_change()
+        self.app_state.notify_change("measurements")
 
     def validate(self) -> bool:
         """Validate the step is complete."""
@@ -147,18 +147,18 @@ class StepOutputSettings(ctk.CTkFrame):
         self.app_state.output_settings.output_directory = folder_path
         self._update_validation()
         self._update_generate_button()
-        self.app_state.notify_change()
+        self.app_state.notify_change("output_settings")
 
     def _on_clothing_toggle(self) -> None:
         """Handle clothing checkbox toggle."""
         self.app_state.output_settings.apply_clothing = self._clothing_var.get()
-        self.app_state.notify_change()
+        self.app_state.notify_change("output_settings")
 
     def _on_filename_change(self, *args) -> None:
         """Handle filename change."""
         self.app_state.output_settings.output_filename = self._filename_var.get() or "avatar"
         self._update_generate_button()
-        self.app_state.notify_change()
+        self.app_state.notify_change("output_settings")
 
     def _update_validation(self) -> None:
         """Update validation message."""